@@ -1,14 +1,60 @@
 """Configuration loading utilities."""
 
+import contextlib
+import functools
+import os
+import pickle
+import tempfile
 from pathlib import Path
 from typing import Any
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # libyaml not available
+    from yaml import SafeLoader  # type: ignore[assignment]
+
 
 def load_yaml_config(filename: str) -> dict[str, Any]:
     """Load a YAML config file from the config/ directory."""
     config_dir = Path(__file__).parent
-    config_path = config_dir / filename
-    with open(config_path) as f:
-        return yaml.safe_load(f)
+    return _load_yaml_path(config_dir / filename)
+
+
+def _load_yaml_path(config_path: Path) -> dict[str, Any]:
+    """Load a YAML file, reusing the parsed result while the file is unchanged.
+
+    Each call returns a fresh object, so callers may mutate the result freely.
+    """
+    mtime_ns = config_path.stat().st_mtime_ns
+    return pickle.loads(_load_pickled(str(config_path), mtime_ns))
+
+
+@functools.lru_cache(maxsize=32)
+def _load_pickled(config_path: str, mtime_ns: int) -> bytes:
+    """Return the pickled contents of a YAML file, via an on-disk sidecar.
+
+    The sidecar ``<file>.pkl`` is reused when it is at least as new as the
+    source; otherwise the YAML is parsed and the sidecar rewritten atomically.
+    The in-process cache is keyed by ``mtime_ns`` so edits are picked up.
+    """
+    sidecar = Path(config_path + ".pkl")
+    with contextlib.suppress(OSError):
+        if sidecar.stat().st_mtime_ns >= mtime_ns:
+            return sidecar.read_bytes()
+
+    with open(config_path, "rb") as f:
+        data = pickle.dumps(yaml.load(f, Loader=SafeLoader), pickle.HIGHEST_PROTOCOL)
+
+    # Best effort: a read-only config directory just means no sidecar.
+    with contextlib.suppress(OSError):
+        fd, tmp_path = tempfile.mkstemp(dir=sidecar.parent, prefix=sidecar.name, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as tmp:
+                tmp.write(data)
+            os.replace(tmp_path, sidecar)
+        except OSError:
+            os.unlink(tmp_path)
+            raise
+    return data
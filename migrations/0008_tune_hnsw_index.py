@@ -0,0 +1,26 @@
+"""Rebuild the chunk embedding HNSW index with m=24, ef_construction=128.
+
+The build memory and parallel worker settings are transaction-local so the
+graph fits in maintenance_work_mem and the build parallelises.
+"""
+
+from yoyo import step
+
+__depends__ = {"0007_query_log_metrics"}
+
+steps = [
+    step(
+        """
+        SET LOCAL maintenance_work_mem = '2GB';
+        SET LOCAL max_parallel_maintenance_workers = 7;
+        DROP INDEX IF EXISTS idx_chunks_embedding;
+        CREATE INDEX idx_chunks_embedding ON document_chunks
+            USING hnsw (embedding vector_cosine_ops) WITH (m = 24, ef_construction = 128)
+        """,
+        """
+        DROP INDEX IF EXISTS idx_chunks_embedding;
+        CREATE INDEX idx_chunks_embedding ON document_chunks
+            USING hnsw (embedding vector_cosine_ops) WITH (m = 16, ef_construction = 64)
+        """,
+    ),
+]
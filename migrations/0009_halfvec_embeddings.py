@@ -0,0 +1,30 @@
+"""Store chunk embeddings as halfvec(768) to halve row and index size.
+
+The HNSW index is tied to the column's operator class, so it is dropped
+before the type change and rebuilt with halfvec_cosine_ops.
+"""
+
+from yoyo import step
+
+__depends__ = {"0008_tune_hnsw_index"}
+
+steps = [
+    step(
+        """
+        SET LOCAL maintenance_work_mem = '2GB';
+        SET LOCAL max_parallel_maintenance_workers = 7;
+        DROP INDEX IF EXISTS idx_chunks_embedding;
+        ALTER TABLE document_chunks
+            ALTER COLUMN embedding TYPE halfvec(768) USING embedding::halfvec(768);
+        CREATE INDEX idx_chunks_embedding ON document_chunks
+            USING hnsw (embedding halfvec_cosine_ops) WITH (m = 24, ef_construction = 128)
+        """,
+        """
+        DROP INDEX IF EXISTS idx_chunks_embedding;
+        ALTER TABLE document_chunks
+            ALTER COLUMN embedding TYPE vector(768) USING embedding::vector(768);
+        CREATE INDEX idx_chunks_embedding ON document_chunks
+            USING hnsw (embedding vector_cosine_ops) WITH (m = 24, ef_construction = 128)
+        """,
+    ),
+]
@@ -0,0 +1,24 @@
+"""Add a partial HNSW index over chunks for the current tax years.
+
+Year-filtered vector queries can make the planner abandon the full HNSW
+index. A partial index whose predicate matches the retriever's filter keeps
+those queries on an ANN scan. Keep the year list in sync with
+``_PARTIAL_INDEX_TAX_YEARS`` in src/rag/retriever.py.
+"""
+
+from yoyo import step
+
+__depends__ = {"0009_halfvec_embeddings"}
+
+steps = [
+    step(
+        """
+        SET LOCAL maintenance_work_mem = '2GB';
+        SET LOCAL max_parallel_maintenance_workers = 7;
+        CREATE INDEX idx_chunks_embedding_current ON document_chunks
+            USING hnsw (embedding halfvec_cosine_ops) WITH (m = 24, ef_construction = 128)
+            WHERE tax_year IN ('2024-25', '2025-26')
+        """,
+        "DROP INDEX IF EXISTS idx_chunks_embedding_current",
+    ),
+]
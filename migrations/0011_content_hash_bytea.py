@@ -0,0 +1,22 @@
+"""Store document_sources.content_hash as raw bytea instead of hex text.
+
+Halves the column footprint. No index is added: sources are looked up by
+URL, never by hash.
+"""
+
+from yoyo import step
+
+__depends__ = {"0010_partial_hnsw_current_years"}
+
+steps = [
+    step(
+        """
+        ALTER TABLE document_sources
+            ALTER COLUMN content_hash TYPE bytea USING decode(content_hash, 'hex')
+        """,
+        """
+        ALTER TABLE document_sources
+            ALTER COLUMN content_hash TYPE TEXT USING encode(content_hash, 'hex')
+        """,
+    ),
+]
@@ -0,0 +1,22 @@
+"""Turn document_chunks.search_vector into a plain column written by ingestion.
+
+The generated column made every INSERT run to_tsvector inside the write
+transaction. The pipeline now computes tsvectors up front (concurrently with
+embedding) and writes them with the chunk. Existing values are kept.
+"""
+
+from yoyo import step
+
+__depends__ = {"0011_content_hash_bytea"}
+
+steps = [
+    step(
+        "ALTER TABLE document_chunks ALTER COLUMN search_vector DROP EXPRESSION",
+        """
+        ALTER TABLE document_chunks DROP COLUMN search_vector;
+        ALTER TABLE document_chunks ADD COLUMN search_vector tsvector
+            GENERATED ALWAYS AS (to_tsvector('english', content)) STORED;
+        CREATE INDEX idx_chunks_search ON document_chunks USING gin (search_vector)
+        """,
+    ),
+]
@@ -0,0 +1,25 @@
+"""Add a covering index for per-source chunk hydration.
+
+Chunk metadata can then be read by (source_id, chunk_index) with an
+index-only scan. content is not included: chunks run up to 6000 chars,
+past btree's ~2.7KB tuple limit, so inserts of long chunks would fail.
+
+Runs outside a transaction for CREATE INDEX CONCURRENTLY and VACUUM.
+"""
+
+from yoyo import step
+
+__depends__ = {"0012_search_vector_plain_column"}
+__transactional__ = False
+
+steps = [
+    step(
+        """
+        CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_chunks_covering ON document_chunks
+            (source_id, chunk_index) INCLUDE (section_title, section_id, tax_year)
+        """,
+        "DROP INDEX CONCURRENTLY IF EXISTS idx_chunks_covering",
+    ),
+    # Refresh the visibility map so index-only scans skip heap fetches
+    step("VACUUM (ANALYZE) document_chunks"),
+]
@@ -0,0 +1,23 @@
+"""Index query_log.created_at for time-window reports.
+
+query_log is append-only, so a BRIN index restricts the report's window
+scan to recent block ranges at a tiny size. The detail listings all read
+from the report's materialized window, so they need no indexes of their own.
+
+Runs outside a transaction for CREATE INDEX CONCURRENTLY.
+"""
+
+from yoyo import step
+
+__depends__ = {"0013_chunks_covering_index"}
+__transactional__ = False
+
+steps = [
+    step(
+        """
+        CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_query_log_created_at_brin
+            ON query_log USING brin (created_at) WITH (pages_per_range = 32)
+        """,
+        "DROP INDEX CONCURRENTLY IF EXISTS idx_query_log_created_at_brin",
+    ),
+]
@@ -0,0 +1,17 @@
+"""Record which algorithm produced document_sources.content_hash.
+
+Existing rows were all hashed with SHA-256. Change detection only compares
+hashes made with the same algorithm, so switching algorithms re-ingests
+each source once instead of misreading every hash as a change.
+"""
+
+from yoyo import step
+
+__depends__ = {"0014_query_log_time_indexes"}
+
+steps = [
+    step(
+        "ALTER TABLE document_sources ADD COLUMN hash_algo TEXT NOT NULL DEFAULT 'sha256'",
+        "ALTER TABLE document_sources DROP COLUMN hash_algo",
+    ),
+]
@@ -0,0 +1,27 @@
+"""Create parsed_document_cache for reusing parser output on forced re-ingests.
+
+One row per URL holds the parsed document and its chunks, keyed to the
+content hash and parser version that produced them. A row only counts as a
+hit when all three match, so stale entries are simply overwritten.
+"""
+
+from yoyo import step
+
+__depends__ = {"0015_content_hash_algo"}
+
+steps = [
+    step(
+        """
+        CREATE TABLE parsed_document_cache (
+            url             TEXT PRIMARY KEY,
+            content_hash    BYTEA NOT NULL,
+            hash_algo       TEXT NOT NULL,
+            parser_version  TEXT NOT NULL,
+            parsed          JSONB NOT NULL,
+            chunks          JSONB NOT NULL,
+            created_at      TIMESTAMPTZ DEFAULT NOW()
+        )
+        """,
+        "DROP TABLE IF EXISTS parsed_document_cache",
+    ),
+]
@@ -16,6 +16,9 @@ Usage:
     # Dry run (crawl, parse, chunk but don't embed or store)
     python scripts/ingest.py --dry-run
 
+    # Process up to 4 sources at a time
+    python scripts/ingest.py --concurrency 4
+
     # Verbose logging
     python scripts/ingest.py -v
 """
@@ -26,6 +29,7 @@ import logging
 import sys
 from datetime import date
 from pathlib import Path
+from typing import Any
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -39,6 +43,17 @@ from src.rag.embedder import GeminiEmbedder
 logger = logging.getLogger(__name__)
 
 
+def _positive_int(value: str) -> int:
+    """argparse type for counts that must be at least 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}") from None
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Run the NZ Tax RAG ingestion pipeline")
     parser.add_argument("--url", help="Process a single URL instead of all sources")
@@ -58,6 +73,12 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Crawl and parse but don't embed or store",
     )
+    parser.add_argument(
+        "--concurrency",
+        type=_positive_int,
+        default=8,
+        help="Max sources processed at once (default: 8); crawl rate limit still applies",
+    )
     parser.add_argument("-v", "--verbose", action="store_true", help="Verbose logging")
     return parser.parse_args()
 
@@ -67,7 +88,7 @@ async def run(args: argparse.Namespace) -> None:
     crawler = Crawler()
     pipeline = IngestionPipeline(embedder=embedder, crawler=crawler)
 
-    results: list[dict] = []
+    results: list[dict[str, Any]] = []
 
     try:
         if args.url:
@@ -85,7 +106,9 @@ async def run(args: argparse.Namespace) -> None:
             sources = config.get("sources", [])
             logger.info("Processing %d sources from config/%s", len(sources), args.config)
 
-            for source in sources:
+            semaphore = asyncio.Semaphore(args.concurrency)
+
+            async def process_source(source: dict[str, Any]) -> dict[str, Any]:
                 # Parse issue_date from YAML string if present
                 issue_date: date | None = None
                 raw_date = source.get("issue_date")
@@ -94,20 +117,22 @@ async def run(args: argparse.Namespace) -> None:
                 elif isinstance(raw_date, date):
                     issue_date = raw_date
 
-                try:
-                    result = await pipeline.process_url(
-                        url=source["url"],
-                        source_type=source.get("source_type", "ird_guidance"),
-                        title=source.get("title"),
-                        force=args.force,
-                        dry_run=args.dry_run,
-                        identifier=source.get("identifier"),
-                        issue_date=issue_date,
-                    )
-                    results.append(result)
-                except Exception:
-                    logger.exception("Failed to process %s", source["url"])
-                    results.append({"url": source["url"], "error": True})
+                async with semaphore:
+                    try:
+                        return await pipeline.process_url(
+                            url=source["url"],
+                            source_type=source.get("source_type", "ird_guidance"),
+                            title=source.get("title"),
+                            force=args.force,
+                            dry_run=args.dry_run,
+                            identifier=source.get("identifier"),
+                            issue_date=issue_date,
+                        )
+                    except Exception:
+                        logger.exception("Failed to process %s", source["url"])
+                        return {"url": source["url"], "error": True}
+
+            results.extend(await asyncio.gather(*(process_source(s) for s in sources)))
 
         # Summary
         total = len(results)
@@ -125,6 +150,8 @@ async def run(args: argparse.Namespace) -> None:
             total_chunks,
         )
     finally:
+        await pipeline.aclose()
+        await crawler.aclose()
         await close_pool()
 
 
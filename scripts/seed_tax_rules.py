@@ -6,6 +6,7 @@ from datetime import date
 from pathlib import Path
 
 import psycopg2
+from psycopg2.extras import execute_values
 
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
@@ -28,61 +29,70 @@ def main() -> None:
     conn = psycopg2.connect(db_url)
     cur = conn.cursor()
 
-    inserted = 0
-    for year_label, data in TAX_YEARS.items():
-        start_date, end_date = YEAR_DATES[year_label]
-
-        # Upsert tax year
-        cur.execute(
-            """
-            INSERT INTO tax_years (
-                year_label, start_date, end_date,
-                acc_rate, acc_max_earnings, sl_threshold, sl_rate
-            ) VALUES (%s, %s, %s, %s, %s, %s, %s)
-            ON CONFLICT (year_label) DO UPDATE SET
-                acc_rate = EXCLUDED.acc_rate,
-                acc_max_earnings = EXCLUDED.acc_max_earnings,
-                sl_threshold = EXCLUDED.sl_threshold,
-                sl_rate = EXCLUDED.sl_rate
-            RETURNING id
-            """,
-            (
-                year_label,
-                start_date,
-                end_date,
-                float(data.acc.rate),
-                float(data.acc.max_liable_earnings),
-                float(data.student_loan.annual_threshold),
-                float(data.student_loan.repayment_rate),
-            ),
+    # Upsert all tax years in one statement
+    year_rows = [
+        (
+            year_label,
+            *YEAR_DATES[year_label],
+            float(data.acc.rate),
+            float(data.acc.max_liable_earnings),
+            float(data.student_loan.annual_threshold),
+            float(data.student_loan.repayment_rate),
         )
-        tax_year_id = cur.fetchone()[0]
-
-        # Delete existing brackets for this year (idempotent re-seed)
-        cur.execute("DELETE FROM tax_brackets WHERE tax_year_id = %s", (tax_year_id,))
-
-        for sort_order, bracket in enumerate(data.brackets):
-            cur.execute(
-                """
-                INSERT INTO tax_brackets (tax_year_id, lower_bound, upper_bound, rate, sort_order)
-                VALUES (%s, %s, %s, %s, %s)
-                """,
-                (
-                    tax_year_id,
-                    float(bracket.lower),
-                    float(bracket.upper) if bracket.upper is not None else None,
-                    float(bracket.rate),
-                    sort_order,
-                ),
-            )
+        for year_label, data in TAX_YEARS.items()
+    ]
+    returned = execute_values(
+        cur,
+        """
+        INSERT INTO tax_years (
+            year_label, start_date, end_date,
+            acc_rate, acc_max_earnings, sl_threshold, sl_rate
+        ) VALUES %s
+        ON CONFLICT (year_label) DO UPDATE SET
+            acc_rate = EXCLUDED.acc_rate,
+            acc_max_earnings = EXCLUDED.acc_max_earnings,
+            sl_threshold = EXCLUDED.sl_threshold,
+            sl_rate = EXCLUDED.sl_rate
+        RETURNING id, year_label
+        """,
+        year_rows,
+        fetch=True,
+    )
+    year_ids: dict[str, str] = {label: year_id for year_id, label in returned}
+
+    # Delete existing brackets for these years (idempotent re-seed)
+    cur.execute(
+        "DELETE FROM tax_brackets WHERE tax_year_id = ANY(%s::uuid[])",
+        (list(year_ids.values()),),
+    )
+
+    bracket_rows = [
+        (
+            year_ids[year_label],
+            float(bracket.lower),
+            float(bracket.upper) if bracket.upper is not None else None,
+            float(bracket.rate),
+            sort_order,
+        )
+        for year_label, data in TAX_YEARS.items()
+        for sort_order, bracket in enumerate(data.brackets)
+    ]
+    execute_values(
+        cur,
+        """
+        INSERT INTO tax_brackets (tax_year_id, lower_bound, upper_bound, rate, sort_order)
+        VALUES %s
+        """,
+        bracket_rows,
+    )
 
-        inserted += 1
+    for year_label, data in TAX_YEARS.items():
         logger.info("Seeded %s (%d brackets)", year_label, len(data.brackets))
 
     conn.commit()
     cur.close()
     conn.close()
-    logger.info("Seeded %d tax years.", inserted)
+    logger.info("Seeded %d tax years.", len(year_ids))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,106 @@
+"""Asyncio queue drained in batches by a background collector task.
+
+Used where many small producers feed one batched consumer: query_log rows
+written with COPY, and chunk texts sent to the embedding API.
+"""
+
+import asyncio
+import contextlib
+import logging
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+class BatchQueue:
+    """Queue whose items are handed to ``handler`` in batches.
+
+    A collector task started on first use sends a batch once it holds
+    ``max_items`` items or ``max_wait`` seconds after its first item,
+    whichever comes first. Batches are handled one at a time, or as
+    separate tasks when ``concurrent`` is set (the handler then bounds its
+    own concurrency). Handler errors are logged, not raised.
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[list[Any]], Awaitable[None]],
+        *,
+        max_items: int,
+        max_wait: float,
+        maxsize: int = 0,
+        concurrent: bool = False,
+    ) -> None:
+        self._handler = handler
+        self._max_items = max_items
+        self._max_wait = max_wait
+        self._maxsize = maxsize
+        self._concurrent = concurrent
+        self._queue: asyncio.Queue[Any] = asyncio.Queue(maxsize=maxsize)
+        self._task: asyncio.Task[None] | None = None
+        self._handling: set[asyncio.Task[None]] = set()
+
+    @property
+    def running(self) -> bool:
+        """Whether the collector task is alive."""
+        return self._task is not None and not self._task.done()
+
+    async def put(self, item: Any) -> None:
+        """Queue an item, starting the collector if needed.
+
+        Only waits when a bounded queue is full.
+        """
+        if not self.running:
+            if self._queue.empty():
+                # A queue binds to the loop that first waits on it; start
+                # fresh so a new event loop doesn't inherit a stale one
+                self._queue = asyncio.Queue(maxsize=self._maxsize)
+            self._task = asyncio.create_task(self._run())
+        await self._queue.put(item)
+
+    async def flush(self) -> None:
+        """Wait until every queued item has been handled."""
+        if self.running:
+            await self._queue.join()
+
+    async def close(self) -> None:
+        """Handle any queued items, then stop the collector task."""
+        await self.flush()
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self._max_wait
+            while len(batch) < self._max_items:
+                if not self._queue.empty():
+                    batch.append(self._queue.get_nowait())
+                    continue
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except TimeoutError:
+                    break
+            if self._concurrent:
+                task = asyncio.create_task(self._handle(batch))
+                self._handling.add(task)
+                task.add_done_callback(self._handling.discard)
+            else:
+                await self._handle(batch)
+
+    async def _handle(self, batch: list[Any]) -> None:
+        try:
+            await self._handler(batch)
+        except Exception:
+            logger.exception("Failed to handle a batch of %d items", len(batch))
+        finally:
+            for _ in batch:
+                self._queue.task_done()
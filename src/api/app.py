@@ -1,18 +1,22 @@
 """FastAPI application factory."""
 
 import base64
+import binascii
+import functools
+import hashlib
+import hmac
 import logging
-import secrets
+import os
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
-from pathlib import Path
 
 from fastapi import FastAPI, Request, Response
 from fastapi.staticfiles import StaticFiles
 from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import Scope
 
 from config.settings import settings
-from src.api.routes import router
+from src.api.routes import STATIC_DIR, router
 from src.db.session import close_pool, get_pool
 from src.llm.gateway import LLMGateway
 from src.orchestrator import Orchestrator
@@ -43,7 +47,29 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     await close_pool()
 
 
-STATIC_DIR = Path(__file__).resolve().parent.parent.parent / "static"
+# Static assets aren't fingerprinted, so no "immutable": after a day browsers
+# revalidate with the ETag / Last-Modified that StaticFiles already sends
+_STATIC_CACHE_CONTROL = "public, max-age=86400"
+
+
+class CachedStaticFiles(StaticFiles):
+    """StaticFiles that adds a Cache-Control header to every file response."""
+
+    def __init__(self, *, cache_control: str = _STATIC_CACHE_CONTROL, **kwargs: object) -> None:
+        super().__init__(**kwargs)  # type: ignore[arg-type]
+        self._cache_control = cache_control
+
+    def file_response(
+        self,
+        full_path: str | os.PathLike[str],
+        stat_result: os.stat_result,
+        scope: Scope,
+        status_code: int = 200,
+    ) -> Response:
+        response = super().file_response(full_path, stat_result, scope, status_code)
+        response.headers["Cache-Control"] = self._cache_control
+        return response
+
 
 UNAUTHORIZED = Response(
     content="Unauthorized",
@@ -52,22 +78,35 @@ UNAUTHORIZED = Response(
 )
 
 
+# Health probes and static assets skip auth entirely
+_AUTH_EXEMPT_PATHS = frozenset({"/health"})
+_AUTH_EXEMPT_PREFIXES = ("/static/",)
+
+
+@functools.lru_cache(maxsize=1)
+def _credentials_digest(username: str, password: str) -> bytes:
+    """SHA-256 of the expected ``username:password`` Basic Auth payload."""
+    return hashlib.sha256(f"{username}:{password}".encode()).digest()
+
+
 class BasicAuthMiddleware(BaseHTTPMiddleware):
-    """Enforce HTTP Basic Auth on all requests."""
+    """Enforce HTTP Basic Auth on all requests except probes and static assets."""
 
     async def dispatch(self, request: Request, call_next):  # type: ignore[override]
+        path = request.url.path
+        if path in _AUTH_EXEMPT_PATHS or path.startswith(_AUTH_EXEMPT_PREFIXES):
+            return await call_next(request)
+
         auth = request.headers.get("Authorization")
         if auth and auth.startswith("Basic "):
             try:
-                decoded = base64.b64decode(auth[6:]).decode()
-                username, password = decoded.split(":", 1)
-            except Exception:
+                credentials = base64.b64decode(auth[6:], validate=True)
+            except binascii.Error:
                 return UNAUTHORIZED
-            if secrets.compare_digest(
-                username.encode(), settings.auth_username.encode()
-            ) and secrets.compare_digest(
-                password.encode(), settings.auth_password.encode()
-            ):
+            # Comparing fixed-size digests of the whole payload is constant-time
+            # and avoids decoding/splitting the credentials
+            expected = _credentials_digest(settings.auth_username, settings.auth_password)
+            if hmac.compare_digest(hashlib.sha256(credentials).digest(), expected):
                 return await call_next(request)
         return UNAUTHORIZED
 
@@ -77,5 +116,5 @@ def create_app() -> FastAPI:
     app = FastAPI(title="NZ Tax RAG", lifespan=lifespan)
     app.add_middleware(BasicAuthMiddleware)
     app.include_router(router)
-    app.mount("/static", StaticFiles(directory=str(STATIC_DIR)), name="static")
+    app.mount("/static", CachedStaticFiles(directory=str(STATIC_DIR)), name="static")
     return app
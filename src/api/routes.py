@@ -1,13 +1,19 @@
 """API routes for the NZ Tax RAG system."""
 
-import json
+import asyncio
+import functools
 import logging
+import os
+import time
+from collections.abc import AsyncIterator, Callable, Coroutine
 from pathlib import Path
-from typing import Literal
+from typing import Any, Literal
 from uuid import UUID
 
+import orjson
 from fastapi import APIRouter, Request
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi.responses import FileResponse, JSONResponse, Response
+from fastapi.routing import APIRoute
 from pydantic import BaseModel
 from starlette.responses import StreamingResponse
 
@@ -16,9 +22,34 @@ from src.db.query_log import get_query_stats, update_feedback
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter()
+
+class _ORJSONRequest(Request):
+    """Request whose JSON body is decoded with orjson instead of the stdlib."""
+
+    async def json(self) -> Any:
+        if not hasattr(self, "_json"):
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError, so FastAPI
+            # still turns malformed bodies into a 422
+            self._json = orjson.loads(await self.body())
+        return self._json
+
+
+class _ORJSONRoute(APIRoute):
+    """Route class that hands handlers an orjson-decoding request."""
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        original_handler = super().get_route_handler()
+
+        async def handler(request: Request) -> Response:
+            return await original_handler(_ORJSONRequest(request.scope, request.receive))
+
+        return handler
+
+
+router = APIRouter(route_class=_ORJSONRoute)
 
 STATIC_DIR = Path(__file__).resolve().parent.parent.parent / "static"
+INDEX_PATH = STATIC_DIR / "index.html"
 
 
 class AskRequest(BaseModel):
@@ -39,29 +70,64 @@ class FeedbackRequest(BaseModel):
 @router.get("/", include_in_schema=False)
 async def index() -> FileResponse:
     """Serve the frontend."""
-    return FileResponse(STATIC_DIR / "index.html")
+    return FileResponse(INDEX_PATH, stat_result=_index_stat())
+
 
+@functools.cache
+def _index_stat() -> os.stat_result:
+    """Stat index.html once; it only changes with a redeploy."""
+    return os.stat(INDEX_PATH)
 
-@router.get("/favicon.ico", include_in_schema=False)
-async def favicon() -> FileResponse:
-    """Redirect /favicon.ico to the SVG favicon."""
-    return FileResponse(STATIC_DIR / "favicon.svg", media_type="image/svg+xml")
+
+# Reuse query stats for a few seconds so dashboards polling /stats don't
+# turn into one DB round-trip per request
+_STATS_TTL_SECONDS = 10.0
+_stats_cache: tuple[float, dict[str, Any]] | None = None
+_stats_lock = asyncio.Lock()
+
+
+async def _cached_query_stats(pool: Any) -> dict[str, Any]:
+    """Return query stats, refreshing at most once per TTL across concurrent callers."""
+    global _stats_cache
+    if _stats_cache and time.monotonic() - _stats_cache[0] < _STATS_TTL_SECONDS:
+        return _stats_cache[1]
+    async with _stats_lock:
+        # Another caller may have refreshed while we waited for the lock
+        if _stats_cache and time.monotonic() - _stats_cache[0] < _STATS_TTL_SECONDS:
+            return _stats_cache[1]
+        stats = await get_query_stats(pool)
+        _stats_cache = (time.monotonic(), stats)
+        return stats
 
 
 @router.get("/health")
-async def health(request: Request) -> dict:  # type: ignore[type-arg]
-    """Health check endpoint with optional query stats."""
-    result: dict[str, object] = {"status": "ok"}
+async def health() -> dict[str, str]:
+    """Liveness probe. Served without auth, so it reports nothing else."""
+    return {"status": "ok"}
+
+
+@router.get("/stats")
+async def stats(request: Request) -> dict[str, Any]:
+    """Aggregate query stats (volume, latency, feedback, errors)."""
     pool = getattr(request.app.state, "pool", None)
-    if pool is not None:
-        stats = await get_query_stats(pool)
-        if stats:
-            result["query_stats"] = stats
-    return result
+    query_stats = await _cached_query_stats(pool) if pool is not None else {}
+    return {"query_stats": query_stats}
 
 
 _MAX_HISTORY_TURNS = 5
 
+# SSE framing, pre-encoded so events go to Starlette as bytes
+_SSE_PREFIX = b"data: "
+_SSE_SUFFIX = b"\n\n"
+_SSE_ERROR_EVENT = (
+    _SSE_PREFIX + orjson.dumps({"type": "error", "message": "An error occurred"}) + _SSE_SUFFIX
+)
+
+# Answer chunks are flushed once this many bytes are buffered, or when this
+# long has passed since the previous flush
+_SSE_BATCH_BYTES = 4096
+_SSE_BATCH_SECONDS = 0.02
+
 
 @router.post("/ask", response_model=AskResponse)
 async def ask(body: AskRequest, request: Request) -> AskResponse:
@@ -77,13 +143,53 @@ async def ask_stream(body: AskRequest, request: Request) -> StreamingResponse:
     orchestrator = request.app.state.orchestrator
     history = body.history[:_MAX_HISTORY_TURNS] or None
 
-    async def event_generator():  # type: ignore[no-untyped-def]
+    async def event_generator() -> AsyncIterator[bytes]:
+        # Coalesce back-to-back answer chunks into fewer writes. Any other
+        # event type, a full buffer, or a gap since the last flush sends
+        # immediately, so the first chunk and status changes aren't delayed.
+        # Buffered chunks never wait longer than _SSE_BATCH_SECONDS: the next
+        # event is awaited with that deadline, and the buffer is flushed if it
+        # passes first.
+        buf = bytearray()
+        last_flush = time.monotonic()
+        next_event: asyncio.Future[dict[str, Any] | None] | None = None
         try:
-            async for event in orchestrator.ask_stream(body.question, history=history):
-                yield f"data: {json.dumps(event)}\n\n"
+            events = aiter(orchestrator.ask_stream(body.question, history=history))
+            while True:
+                if next_event is None:
+                    next_event = asyncio.ensure_future(anext(events, None))
+                timeout = (
+                    max(0.0, last_flush + _SSE_BATCH_SECONDS - time.monotonic()) if buf else None
+                )
+                done, _ = await asyncio.wait((next_event,), timeout=timeout)
+                if not done:
+                    # Deadline passed with the event still pending; it keeps running
+                    yield bytes(buf)
+                    buf.clear()
+                    last_flush = time.monotonic()
+                    continue
+                event = next_event.result()
+                next_event = None
+                if event is None:
+                    break
+                buf += _SSE_PREFIX + orjson.dumps(event) + _SSE_SUFFIX
+                now = time.monotonic()
+                if (
+                    event.get("type") != "chunk"
+                    or len(buf) >= _SSE_BATCH_BYTES
+                    or now - last_flush >= _SSE_BATCH_SECONDS
+                ):
+                    yield bytes(buf)
+                    buf.clear()
+                    last_flush = now
         except Exception:
             logger.exception("Error during streaming")
-            yield f"data: {json.dumps({'type': 'error', 'message': 'An error occurred'})}\n\n"
+            buf += _SSE_ERROR_EVENT
+        finally:
+            if next_event is not None:
+                next_event.cancel()
+        if buf:
+            yield bytes(buf)
 
     return StreamingResponse(
         event_generator(),
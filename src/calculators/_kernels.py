@@ -0,0 +1,110 @@
+"""Integer bracket arithmetic shared by the calculators.
+
+Amounts are whole cents and rates are integer millionths, so the tax on a
+bracket is an exact integer in "cent-micros" (cents x 1,000,000) and the
+loop never touches Decimal. Callers convert to float only at the boundary,
+where true division of the exact integers rounds the same way float(Decimal)
+does.
+"""
+
+from bisect import bisect_left
+from decimal import ROUND_HALF_UP, Decimal
+from typing import NamedTuple
+
+from src.calculators.tax_data import TAX_YEARS, TaxBracket
+
+RATE_SCALE = 1_000_000
+CENT_MICROS_PER_DOLLAR = 100 * RATE_SCALE
+_CENT = Decimal("0.01")
+
+
+class LevyTable(NamedTuple):
+    """Integer view of a flat-rate levy: the ACC cap or the student loan threshold."""
+
+    limit_cents: int
+    rate_micros: int
+
+
+class BracketTable(NamedTuple):
+    """Flat integer view of a tax year's brackets."""
+
+    lower_cents: tuple[int, ...]
+    upper_cents: tuple[int, ...]  # -1 = no cap
+    rate_micros: tuple[int, ...]
+
+
+def to_cents(amount: Decimal) -> int:
+    """Convert a dollar amount to whole cents, rounding half up.
+
+    Calculators round the income once here and report the rounded amount,
+    so a sub-cent input such as 1968.103 is taxed and shown as 1968.10.
+    """
+    return int(amount.quantize(_CENT, rounding=ROUND_HALF_UP) * 100)
+
+
+def to_micros(rate: Decimal) -> int:
+    """Convert a fractional rate to integer millionths."""
+    return int(rate * RATE_SCALE)
+
+
+def _bracket_table(brackets: tuple[TaxBracket, ...]) -> BracketTable:
+    return BracketTable(
+        lower_cents=tuple(to_cents(b.lower) for b in brackets),
+        upper_cents=tuple(to_cents(b.upper) if b.upper is not None else -1 for b in brackets),
+        rate_micros=tuple(to_micros(b.rate) for b in brackets),
+    )
+
+
+BRACKET_TABLES: dict[str, BracketTable] = {
+    year: _bracket_table(data.brackets) for year, data in TAX_YEARS.items()
+}
+
+# ACC: limit is the maximum liable earnings
+ACC_TABLES: dict[str, LevyTable] = {
+    year: LevyTable(to_cents(data.acc.max_liable_earnings), to_micros(data.acc.rate))
+    for year, data in TAX_YEARS.items()
+}
+
+# Student loan: limit is the repayment threshold
+STUDENT_LOAN_TABLES: dict[str, LevyTable] = {
+    year: LevyTable(
+        to_cents(data.student_loan.annual_threshold),
+        to_micros(data.student_loan.repayment_rate),
+    )
+    for year, data in TAX_YEARS.items()
+}
+
+
+def income_tax_cents(income_cents: int, table: BracketTable) -> list[tuple[int, int, int]]:
+    """Apply a bracket table to an income.
+
+    Args:
+        income_cents: Gross annual income in cents (>= 0).
+        table: Bracket table for the tax year.
+
+    Returns:
+        One (upper_cents, taxable_cents, tax_cent_micros) tuple per bracket
+        the income reaches, where upper_cents is the effective cap used.
+    """
+    # Brackets are sorted by lower bound; the income reaches every bracket
+    # whose lower bound is below it, so binary search finds the top one
+    reached = bisect_left(table.lower_cents, income_cents)
+    result: list[tuple[int, int, int]] = []
+    for i in range(reached):
+        lower = table.lower_cents[i]
+        upper = table.upper_cents[i]
+        if upper < 0:
+            upper = income_cents
+        taxable = min(income_cents, upper) - lower
+        result.append((upper, taxable, taxable * table.rate_micros[i]))
+    return result
+
+
+def acc_levy_cents(income_cents: int, table: LevyTable) -> int:
+    """ACC levy in cent-micros: the rate applied up to the liable earnings cap."""
+    return min(income_cents, table.limit_cents) * table.rate_micros
+
+
+def student_loan_cents(income_cents: int, table: LevyTable) -> int:
+    """Student loan repayment in cent-micros: the rate applied above the threshold."""
+    return max(0, income_cents - table.limit_cents) * table.rate_micros
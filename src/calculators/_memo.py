@@ -0,0 +1,40 @@
+"""Memoization for the pure calculator functions.
+
+The agent asks for the same handful of round incomes over and over, and the
+calculators are deterministic in their arguments, so results are cached. Each
+call gets a fresh copy of the cached dict so callers can't mutate the cache.
+"""
+
+import functools
+from collections.abc import Callable
+from typing import Any
+
+_CACHE_SIZE = 4096
+
+
+def _copy(value: Any) -> Any:
+    """Copy the dict/list structure of a result; leaves are immutable scalars."""
+    if isinstance(value, dict):
+        return {k: _copy(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_copy(v) for v in value]
+    return value
+
+
+def memoize_result(
+    func: Callable[..., dict[str, Any]],
+) -> Callable[..., dict[str, Any]]:
+    """LRU-cache a calculator and return a copy of the cached result on each call.
+
+    Arguments must be hashable (Decimal, str, bool); equal Decimals such as
+    ``Decimal("65000")`` and ``Decimal("65000.00")`` share an entry.
+    """
+    cached = functools.lru_cache(maxsize=_CACHE_SIZE)(func)
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> dict[str, Any]:
+        return _copy(cached(*args, **kwargs))
+
+    wrapper.cache_clear = cached.cache_clear  # type: ignore[attr-defined]
+    wrapper.cache_info = cached.cache_info  # type: ignore[attr-defined]
+    return wrapper
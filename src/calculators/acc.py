@@ -3,9 +3,18 @@
 from decimal import Decimal
 from typing import Any
 
-from src.calculators.tax_data import DEFAULT_TAX_YEAR, TAX_YEARS
-
-
+from src.calculators._kernels import (
+    ACC_TABLES,
+    CENT_MICROS_PER_DOLLAR,
+    RATE_SCALE,
+    acc_levy_cents,
+    to_cents,
+)
+from src.calculators._memo import memoize_result
+from src.calculators.tax_data import AVAILABLE_TAX_YEARS, DEFAULT_TAX_YEAR, TAX_YEARS
+
+
+@memoize_result
 def calculate_acc_levy(
     annual_income: Decimal,
     tax_year: str = DEFAULT_TAX_YEAR,
@@ -22,20 +31,20 @@ def calculate_acc_levy(
         Dict with annual_levy, acc_rate, max_liable_earnings, tax_year.
     """
     if tax_year not in TAX_YEARS:
-        return {"error": f"Unknown tax year: {tax_year}. Available: {', '.join(sorted(TAX_YEARS))}"}
+        return {"error": f"Unknown tax year: {tax_year}. Available: {AVAILABLE_TAX_YEARS}"}
 
     if annual_income < 0:
         return {"error": "Annual income must be non-negative."}
 
-    acc = TAX_YEARS[tax_year].acc
-    liable_earnings = min(annual_income, acc.max_liable_earnings)
-    levy = liable_earnings * acc.rate
+    acc = ACC_TABLES[tax_year]
+    income_cents = to_cents(annual_income)
+    liable_cents = min(income_cents, acc.limit_cents)
 
     return {
-        "annual_income": float(annual_income),
-        "annual_levy": float(levy),
-        "acc_rate": float(acc.rate),
-        "liable_earnings": float(liable_earnings),
-        "max_liable_earnings": float(acc.max_liable_earnings),
+        "annual_income": income_cents / 100,
+        "annual_levy": acc_levy_cents(income_cents, acc) / CENT_MICROS_PER_DOLLAR,
+        "acc_rate": acc.rate_micros / RATE_SCALE,
+        "liable_earnings": liable_cents / 100,
+        "max_liable_earnings": acc.limit_cents / 100,
         "tax_year": tax_year,
     }
@@ -1,11 +1,28 @@
 """Income tax calculator — bracket-by-bracket breakdown."""
 
+from collections.abc import Sequence
 from decimal import Decimal
 from typing import Any
 
-from src.calculators.tax_data import DEFAULT_TAX_YEAR, TAX_YEARS
+import numpy as np
 
+from src.calculators._kernels import (
+    BRACKET_TABLES,
+    CENT_MICROS_PER_DOLLAR,
+    RATE_SCALE,
+    income_tax_cents,
+    to_cents,
+)
+from src.calculators._memo import memoize_result
+from src.calculators.tax_data import AVAILABLE_TAX_YEARS, DEFAULT_TAX_YEAR, TAX_YEARS
 
+# Batch amounts are int64 cent-micros. Rates are at most 100%, so the largest
+# intermediate (total tax x 100 for the effective rate) stays below
+# income_cents x 100 x RATE_SCALE; larger incomes would silently wrap
+_MAX_BATCH_INCOME_CENTS = int(np.iinfo(np.int64).max) // (100 * RATE_SCALE)
+
+
+@memoize_result
 def calculate_income_tax(
     annual_income: Decimal,
     tax_year: str = DEFAULT_TAX_YEAR,
@@ -20,38 +37,97 @@ def calculate_income_tax(
         Dict with total_tax, effective_rate, breakdown, tax_year, notes.
     """
     if tax_year not in TAX_YEARS:
-        return {"error": f"Unknown tax year: {tax_year}. Available: {', '.join(sorted(TAX_YEARS))}"}
+        return {"error": f"Unknown tax year: {tax_year}. Available: {AVAILABLE_TAX_YEARS}"}
 
     if annual_income < 0:
         return {"error": "Annual income must be non-negative."}
 
-    data = TAX_YEARS[tax_year]
+    table = BRACKET_TABLES[tax_year]
+    income_cents = to_cents(annual_income)
     breakdown: list[dict[str, Any]] = []
-    total_tax = Decimal("0")
-
-    for bracket in data.brackets:
-        if annual_income <= bracket.lower:
-            break
-
-        upper = bracket.upper if bracket.upper is not None else annual_income
-        taxable = min(annual_income, upper) - bracket.lower
-        tax = taxable * bracket.rate
+    total_tax = 0  # cent-micros
 
+    for i, (upper, taxable, tax) in enumerate(income_tax_cents(income_cents, table)):
         breakdown.append({
-            "lower": float(bracket.lower),
-            "upper": float(upper) if bracket.upper is not None else None,
-            "rate": float(bracket.rate),
-            "taxable_amount": float(taxable),
-            "tax": float(tax),
+            "lower": table.lower_cents[i] / 100,
+            "upper": upper / 100 if table.upper_cents[i] >= 0 else None,
+            "rate": table.rate_micros[i] / RATE_SCALE,
+            "taxable_amount": taxable / 100,
+            "tax": tax / CENT_MICROS_PER_DOLLAR,
         })
         total_tax += tax
 
-    effective_rate = (total_tax / annual_income * 100) if annual_income > 0 else Decimal("0")
+    effective_rate = (
+        Decimal(total_tax) / (income_cents * RATE_SCALE) * 100 if income_cents > 0 else Decimal("0")
+    )
 
     return {
-        "annual_income": float(annual_income),
-        "total_tax": float(total_tax),
+        "annual_income": income_cents / 100,
+        "total_tax": total_tax / CENT_MICROS_PER_DOLLAR,
         "effective_rate": float(round(effective_rate, 2)),
         "breakdown": breakdown,
         "tax_year": tax_year,
     }
+
+
+def calculate_income_tax_batch(
+    annual_incomes: Sequence[Decimal],
+    tax_year: str = DEFAULT_TAX_YEAR,
+) -> dict[str, Any]:
+    """Calculate NZ income tax for many incomes at once.
+
+    Vectorised over incomes with NumPy for sweeps such as effective-rate
+    tables. Per-bracket amounts are exact integer arithmetic, as in
+    calculate_income_tax; only the final conversion to float can differ.
+
+    Args:
+        annual_incomes: Gross annual incomes (each must be >= 0 and small
+            enough for int64 arithmetic, about $922m).
+        tax_year: Tax year key, e.g. "2025-26".
+
+    Returns:
+        Dict with annual_income, total_tax and effective_rate arrays of shape
+        (N,), taxable_amount and tax arrays of shape (N, brackets), plus the
+        bracket lower/upper/rate and tax_year.
+    """
+    if tax_year not in TAX_YEARS:
+        return {"error": f"Unknown tax year: {tax_year}. Available: {AVAILABLE_TAX_YEARS}"}
+
+    if any(income < 0 for income in annual_incomes):
+        return {"error": "Annual income must be non-negative."}
+
+    income_cents = [to_cents(income) for income in annual_incomes]
+    if any(cents > _MAX_BATCH_INCOME_CENTS for cents in income_cents):
+        return {
+            "error": (
+                f"Annual income must not exceed {_MAX_BATCH_INCOME_CENTS // 100:,} "
+                "for batch calculation; use calculate_income_tax instead."
+            )
+        }
+
+    table = BRACKET_TABLES[tax_year]
+    lower = np.array(table.lower_cents, dtype=np.int64)
+    upper_cents = np.array(table.upper_cents, dtype=np.int64)
+    upper = np.where(upper_cents < 0, np.iinfo(np.int64).max, upper_cents)
+    rate = np.array(table.rate_micros, dtype=np.int64)
+    incomes = np.array(income_cents, dtype=np.int64)
+
+    # (N, 1) against (B,): the part of each income falling in each bracket
+    taxable = np.clip(incomes[:, None], lower, upper) - lower
+    tax = taxable * rate
+    total = tax.sum(axis=1)
+
+    effective_rate = np.zeros(len(incomes))
+    np.divide(total * 100, incomes * RATE_SCALE, out=effective_rate, where=incomes > 0)
+
+    return {
+        "annual_income": incomes / 100,
+        "total_tax": total / CENT_MICROS_PER_DOLLAR,
+        "effective_rate": np.round(effective_rate, 2),
+        "taxable_amount": taxable / 100,
+        "tax": tax / CENT_MICROS_PER_DOLLAR,
+        "lower": lower / 100,
+        "upper": [u / 100 if u >= 0 else None for u in table.upper_cents],
+        "rate": rate / RATE_SCALE,
+        "tax_year": tax_year,
+    }
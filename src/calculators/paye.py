@@ -3,9 +3,19 @@
 from decimal import Decimal
 from typing import Any
 
-from src.calculators.acc import calculate_acc_levy
+from src.calculators._kernels import (
+    ACC_TABLES,
+    BRACKET_TABLES,
+    CENT_MICROS_PER_DOLLAR,
+    RATE_SCALE,
+    STUDENT_LOAN_TABLES,
+    acc_levy_cents,
+    income_tax_cents,
+    student_loan_cents,
+    to_cents,
+)
+from src.calculators._memo import memoize_result
 from src.calculators.income_tax import calculate_income_tax
-from src.calculators.student_loan import calculate_student_loan_repayment
 from src.calculators.tax_data import DEFAULT_TAX_YEAR
 
 PAY_PERIODS: dict[str, int] = {
@@ -14,8 +24,10 @@ PAY_PERIODS: dict[str, int] = {
     "four-weekly": 13,
     "monthly": 12,
 }
+_VALID_PAY_PERIODS = ", ".join(sorted(PAY_PERIODS))
 
 
+@memoize_result
 def calculate_paye(
     annual_income: Decimal,
     pay_period: str = "monthly",
@@ -36,59 +48,56 @@ def calculate_paye(
     Returns:
         Dict with per-period and annual breakdowns.
     """
-    if pay_period not in PAY_PERIODS:
-        valid = ", ".join(sorted(PAY_PERIODS))
-        return {"error": f"Invalid pay period: {pay_period}. Must be one of: {valid}"}
+    periods = PAY_PERIODS.get(pay_period)
+    if periods is None:
+        return {
+            "error": f"Invalid pay period: {pay_period}. Must be one of: {_VALID_PAY_PERIODS}"
+        }
 
     tax_result = calculate_income_tax(annual_income, tax_year)
     if "error" in tax_result:
         return tax_result
 
-    acc_result = calculate_acc_levy(annual_income, tax_year)
-    if "error" in acc_result:
-        return acc_result
+    # The calculators share their validation, so only income tax can fail.
+    # Amounts below are exact integers in cent-micros (cents x 1,000,000).
+    income_cents = to_cents(annual_income)
+    annual_tax = sum(tax for _, _, tax in income_tax_cents(income_cents, BRACKET_TABLES[tax_year]))
+    annual_acc = acc_levy_cents(income_cents, ACC_TABLES[tax_year])
+    annual_sl = (
+        student_loan_cents(income_cents, STUDENT_LOAN_TABLES[tax_year]) if has_student_loan else 0
+    )
 
-    periods = PAY_PERIODS[pay_period]
-    annual_tax = Decimal(str(tax_result["total_tax"]))
-    annual_acc = Decimal(str(acc_result["annual_levy"]))
-    annual_sl = Decimal("0")
+    annual_total_deductions = annual_tax + annual_acc + annual_sl
+    annual_gross = income_cents * RATE_SCALE
+    annual_take_home = annual_gross - annual_total_deductions
 
-    sl_result: dict[str, Any] | None = None
-    if has_student_loan:
-        sl_result = calculate_student_loan_repayment(annual_income, tax_year)
-        if "error" in sl_result:
-            return sl_result
-        annual_sl = Decimal(str(sl_result["annual_repayment"]))
+    period_divisor = periods * CENT_MICROS_PER_DOLLAR
 
-    annual_total_deductions = annual_tax + annual_acc + annual_sl
-    annual_take_home = annual_income - annual_total_deductions
+    def annual(units: int) -> float:
+        return units / CENT_MICROS_PER_DOLLAR
 
-    per_period_gross = annual_income / periods
-    per_period_tax = annual_tax / periods
-    per_period_acc = annual_acc / periods
-    per_period_sl = annual_sl / periods
-    per_period_total_deductions = annual_total_deductions / periods
-    per_period_take_home = annual_take_home / periods
+    def per_period(units: int) -> float:
+        return units / period_divisor
 
     result: dict[str, Any] = {
-        "annual_income": float(annual_income),
+        "annual_income": income_cents / 100,
         "pay_period": pay_period,
         "periods_per_year": periods,
         "tax_year": tax_year,
         "annual": {
-            "income_tax": float(annual_tax),
-            "acc_levy": float(annual_acc),
-            "student_loan": float(annual_sl),
-            "total_deductions": float(annual_total_deductions),
-            "take_home": float(annual_take_home),
+            "income_tax": annual(annual_tax),
+            "acc_levy": annual(annual_acc),
+            "student_loan": annual(annual_sl),
+            "total_deductions": annual(annual_total_deductions),
+            "take_home": annual(annual_take_home),
         },
         "per_period": {
-            "gross": float(per_period_gross),
-            "income_tax": float(per_period_tax),
-            "acc_levy": float(per_period_acc),
-            "student_loan": float(per_period_sl),
-            "total_deductions": float(per_period_total_deductions),
-            "take_home": float(per_period_take_home),
+            "gross": per_period(annual_gross),
+            "income_tax": per_period(annual_tax),
+            "acc_levy": per_period(annual_acc),
+            "student_loan": per_period(annual_sl),
+            "total_deductions": per_period(annual_total_deductions),
+            "take_home": per_period(annual_take_home),
         },
         "income_tax_detail": tax_result,
         "notes": (
@@ -3,9 +3,18 @@
 from decimal import Decimal
 from typing import Any
 
-from src.calculators.tax_data import DEFAULT_TAX_YEAR, TAX_YEARS
-
-
+from src.calculators._kernels import (
+    CENT_MICROS_PER_DOLLAR,
+    RATE_SCALE,
+    STUDENT_LOAN_TABLES,
+    student_loan_cents,
+    to_cents,
+)
+from src.calculators._memo import memoize_result
+from src.calculators.tax_data import AVAILABLE_TAX_YEARS, DEFAULT_TAX_YEAR, TAX_YEARS
+
+
+@memoize_result
 def calculate_student_loan_repayment(
     annual_income: Decimal,
     tax_year: str = DEFAULT_TAX_YEAR,
@@ -22,20 +31,20 @@ def calculate_student_loan_repayment(
         Dict with annual_repayment, repayment_rate, threshold, tax_year.
     """
     if tax_year not in TAX_YEARS:
-        return {"error": f"Unknown tax year: {tax_year}. Available: {', '.join(sorted(TAX_YEARS))}"}
+        return {"error": f"Unknown tax year: {tax_year}. Available: {AVAILABLE_TAX_YEARS}"}
 
     if annual_income < 0:
         return {"error": "Annual income must be non-negative."}
 
-    sl = TAX_YEARS[tax_year].student_loan
-    income_above_threshold = max(Decimal("0"), annual_income - sl.annual_threshold)
-    repayment = income_above_threshold * sl.repayment_rate
+    sl = STUDENT_LOAN_TABLES[tax_year]
+    income_cents = to_cents(annual_income)
+    above_cents = max(0, income_cents - sl.limit_cents)
 
     return {
-        "annual_income": float(annual_income),
-        "annual_repayment": float(repayment),
-        "repayment_rate": float(sl.repayment_rate),
-        "annual_threshold": float(sl.annual_threshold),
-        "income_above_threshold": float(income_above_threshold),
+        "annual_income": income_cents / 100,
+        "annual_repayment": student_loan_cents(income_cents, sl) / CENT_MICROS_PER_DOLLAR,
+        "repayment_rate": sl.rate_micros / RATE_SCALE,
+        "annual_threshold": sl.limit_cents / 100,
+        "income_above_threshold": above_cents / 100,
         "tax_year": tax_year,
     }
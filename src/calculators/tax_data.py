@@ -94,3 +94,6 @@ TAX_YEARS: dict[str, TaxYearData] = {
 }
 
 DEFAULT_TAX_YEAR = "2025-26"
+
+# Pre-joined for "unknown tax year" error messages
+AVAILABLE_TAX_YEARS = ", ".join(sorted(TAX_YEARS))
@@ -3,7 +3,8 @@
 from datetime import date, datetime
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+import numpy as np
+from pydantic import BaseModel, ConfigDict, Field
 
 # --- Database row models ---
 
@@ -16,7 +17,8 @@ class DocumentSource(BaseModel):
     source_type: str
     title: str | None = None
     last_crawled_at: datetime | None = None
-    content_hash: str | None = None
+    content_hash: bytes | None = None  # raw digest; CrawlResult carries it as hex
+    hash_algo: str = "sha256"
     identifier: str | None = None
     issue_date: date | None = None
     superseded_by: str | None = None
@@ -28,6 +30,8 @@ class DocumentSource(BaseModel):
 class DocumentChunk(BaseModel):
     """A chunk of content with embedding (maps to document_chunks table)."""
 
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
     id: UUID
     source_id: UUID
     chunk_index: int
@@ -36,7 +40,7 @@ class DocumentChunk(BaseModel):
     section_title: str | None = None
     tax_year: str | None = None
     parent_chunk_id: UUID | None = None
-    embedding: list[float] | None = None
+    embedding: np.ndarray | None = None  # flat array, e.g. HalfVector.to_numpy()
     created_at: datetime
 
 
@@ -49,6 +53,7 @@ class CrawlResult(BaseModel):
     url: str
     html: str
     content_hash: str
+    hash_algo: str = "sha256"
     status_code: int
     crawled_at: datetime = Field(default_factory=datetime.now)
     raw_bytes: bytes | None = None
@@ -1,13 +1,72 @@
 """Async query logging to the query_log table."""
 
-import json
 import logging
-from uuid import UUID
+from datetime import UTC, datetime
+from uuid import UUID, uuid4
 
 import asyncpg
 
+from src._batch_queue import BatchQueue
+
 logger = logging.getLogger(__name__)
 
+_LOG_COLUMNS = (
+    "id", "question", "answer", "model_used", "latency_ms", "tool_calls",
+    "chunks_used", "cost_usd", "error_message", "created_at",
+)
+
+# A batch is written once it reaches _FLUSH_ROWS rows or _FLUSH_INTERVAL
+# seconds after its first row, whichever comes first
+_FLUSH_ROWS = 500
+_FLUSH_INTERVAL = 0.1
+_QUEUE_SIZE = 1000
+
+
+class _QueryLogBuffer:
+    """Queue of pending query_log rows, written in batches with COPY.
+
+    A background task started on first use drains the queue, so logging a
+    query costs a queue put rather than a database round-trip.
+    """
+
+    def __init__(self) -> None:
+        self._pool: asyncpg.Pool | None = None
+        self._rows = BatchQueue(
+            self._write, max_items=_FLUSH_ROWS, max_wait=_FLUSH_INTERVAL, maxsize=_QUEUE_SIZE
+        )
+
+    async def put(self, pool: asyncpg.Pool, record: tuple) -> None:
+        """Queue a row, starting the writer task if needed."""
+        self._pool = pool
+        await self._rows.put(record)
+
+    async def flush(self) -> None:
+        """Wait until every queued row has been written (or failed)."""
+        await self._rows.flush()
+
+    async def close(self) -> None:
+        """Write any pending rows and stop the writer task."""
+        await self._rows.close()
+
+    async def _write(self, batch: list[tuple]) -> None:
+        try:
+            assert self._pool is not None
+            async with self._pool.acquire() as conn:
+                await conn.copy_records_to_table(
+                    "query_log", records=batch, columns=_LOG_COLUMNS
+                )
+        except Exception:
+            logger.exception("Failed to write %d query log rows", len(batch))
+
+
+_buffer = _QueryLogBuffer()
+
+_UPDATE_FEEDBACK_SQL = """
+    UPDATE query_log
+    SET feedback = $2, feedback_note = $3
+    WHERE id = $1
+"""
+
 
 async def log_query(
     pool: asyncpg.Pool,
@@ -20,34 +79,37 @@ async def log_query(
     cost_usd: float | None = None,
     error_message: str | None = None,
 ) -> UUID | None:
-    """Insert a row into query_log and return its ID.
+    """Queue a row for query_log and return its ID.
+
+    The ID is generated client-side so it can be returned before the row is
+    written; a background task copies queued rows in batches.
 
     Fire-and-forget friendly — errors are logged, not raised.
     Returns the query_log row UUID on success, None on failure.
     """
+    query_id = uuid4()
     try:
-        async with pool.acquire() as conn:
-            row = await conn.fetchrow(
-                """
-                INSERT INTO query_log
-                    (question, answer, model_used, latency_ms, tool_calls,
-                     chunks_used, cost_usd, error_message)
-                VALUES ($1, $2, $3, $4, $5::jsonb, $6, $7, $8)
-                RETURNING id
-                """,
-                question,
-                answer,
-                model,
-                latency_ms,
-                json.dumps(tool_calls) if tool_calls else None,
-                chunk_ids or [],
-                cost_usd,
-                error_message,
-            )
-            return UUID(str(row["id"])) if row else None
+        await _buffer.put(pool, (
+            query_id,
+            question,
+            answer,
+            model,
+            latency_ms,
+            tool_calls or None,  # encoded by the jsonb codec in src.db.session
+            chunk_ids or [],
+            cost_usd,
+            error_message,
+            datetime.now(UTC),
+        ))
     except Exception:
         logger.exception("Failed to log query")
         return None
+    return query_id
+
+
+async def flush_query_log() -> None:
+    """Write all queued query_log rows and stop the background writer."""
+    await _buffer.close()
 
 
 async def update_feedback(
@@ -59,17 +121,13 @@ async def update_feedback(
     """Update feedback on a query_log row. Returns True if row was found."""
     try:
         async with pool.acquire() as conn:
-            result = await conn.execute(
-                """
-                UPDATE query_log
-                SET feedback = $2, feedback_note = $3
-                WHERE id = $1
-                """,
-                query_id,
-                feedback,
-                note,
-            )
-            return result == "UPDATE 1"
+            result = await conn.execute(_UPDATE_FEEDBACK_SQL, query_id, feedback, note)
+        if result == "UPDATE 0":
+            # The row may still be queued; write it and retry once
+            await _buffer.flush()
+            async with pool.acquire() as conn:
+                result = await conn.execute(_UPDATE_FEEDBACK_SQL, query_id, feedback, note)
+        return result == "UPDATE 1"
     except Exception:
         logger.exception("Failed to update feedback for query %s", query_id)
         return False
@@ -3,18 +3,36 @@
 import logging
 
 import asyncpg
+import orjson
 from pgvector.asyncpg import register_vector
 
 from config.settings import settings
+from src.db.query_log import flush_query_log
 
 logger = logging.getLogger(__name__)
 
 _pool: asyncpg.Pool | None = None
 
 
+def _encode_jsonb(value: object) -> bytes:
+    # Binary jsonb is a version byte followed by the JSON text
+    return b"\x01" + orjson.dumps(value)
+
+
+def _decode_jsonb(data: bytes) -> object:
+    return orjson.loads(data[1:])
+
+
 async def _init_connection(conn: asyncpg.Connection) -> None:
-    """Register pgvector type on each new connection."""
+    """Register pgvector and an orjson-backed jsonb codec on each new connection."""
     await register_vector(conn)
+    await conn.set_type_codec(
+        "jsonb",
+        encoder=_encode_jsonb,
+        decoder=_decode_jsonb,
+        schema="pg_catalog",
+        format="binary",
+    )
 
 
 async def get_pool() -> asyncpg.Pool:
@@ -33,8 +51,9 @@ async def get_pool() -> asyncpg.Pool:
 
 
 async def close_pool() -> None:
-    """Close the connection pool."""
+    """Write any queued query_log rows, then close the connection pool."""
     global _pool
     if _pool is not None:
+        await flush_query_log()
         await _pool.close()
         _pool = None
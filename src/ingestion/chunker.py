@@ -17,39 +17,62 @@ MAX_CHUNK_CHARS = 6000
 # Sentence boundary pattern for overlap extraction
 _SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?])\s+(?=[A-Z])")
 
-# Tax year patterns
-_TAX_YEAR_PATTERNS = [
-    re.compile(r"(\d{4})[–-](\d{2,4})"),  # 2025-26 or 2025–2026
-    re.compile(r"[Ff]rom\s+1\s+April\s+(\d{4})"),  # From 1 April 2025
-    re.compile(r"[Tt]ax\s+year\s+(\d{4})"),  # Tax year 2025
-    re.compile(r"(\d{4})/(\d{2,4})\s+tax\s+year", re.IGNORECASE),  # 2025/26 tax year
-]
+# Tax year patterns, combined so a single scan reports where each first
+# matches. The zero-width lookahead lets matches overlap as separate searches
+# would, the leading character class skips positions no pattern can start
+# at, and lastindex identifies the alternative that matched:
+#   2025-26 or 2025–2026     -> groups 1, 2
+#   2025/26 tax year         -> groups 1, 3
+#   From 1 April 2025        -> group 4
+#   Tax year 2025            -> group 5
+_TAX_YEAR_RE = re.compile(
+    r"(?=[\dFfTt])(?="
+    r"(\d{4})(?:[–-](\d{2,4})|/(\d{2,4})(?i:\s+tax\s+year))"
+    r"|[Ff]rom\s+1\s+April\s+(\d{4})"
+    r"|[Tt]ax\s+year\s+(\d{4})"
+    r")"
+)
+# lastindex -> pattern priority (earlier patterns win regardless of position)
+_TAX_YEAR_PRIORITY = {2: 0, 4: 1, 5: 2, 3: 3}
+
+
+def _normalise_tax_year(year1: str, year2: str | None) -> str | None:
+    """Format a start year (and optional end year) as 'YYYY-YY'."""
+    if year2 is None:
+        return f"{year1}-{str(int(year1) + 1)[2:]}"
+    if len(year2) == 2:
+        return f"{year1}-{year2}"
+    if len(year2) == 4:
+        return f"{year1}-{year2[2:]}"
+    return None
 
 
 def _detect_tax_year(text: str) -> str | None:
     """Detect tax year from text content.
 
-    Returns the first tax year found, in 'YYYY-YY' format.
+    Only the first occurrence of each pattern counts, and earlier patterns
+    win over later ones regardless of position. Returns the tax year in
+    'YYYY-YY' format.
     """
-    for pattern in _TAX_YEAR_PATTERNS:
-        match = pattern.search(text)
-        if match:
-            groups = match.groups()
-            if len(groups) == 2:
-                year1 = groups[0]
-                year2 = groups[1]
-                # Normalise to YYYY-YY format
-                if len(year1) == 4:
-                    if len(year2) == 2:
-                        return f"{year1}-{year2}"
-                    elif len(year2) == 4:
-                        return f"{year1}-{year2[2:]}"
-            elif len(groups) == 1:
-                year = groups[0]
-                if len(year) == 4:
-                    next_year = str(int(year) + 1)[2:]
-                    return f"{year}-{next_year}"
-    return None
+    found: list[str | None] = [None] * len(_TAX_YEAR_PRIORITY)
+    seen = [False] * len(_TAX_YEAR_PRIORITY)
+    for match in _TAX_YEAR_RE.finditer(text):
+        priority = _TAX_YEAR_PRIORITY[match.lastindex or 0]
+        if seen[priority]:
+            continue
+        seen[priority] = True
+        year1, dash_year2, slash_year2, from_year, tax_year = match.groups()
+        if year1 is not None:
+            found[priority] = _normalise_tax_year(year1, dash_year2 or slash_year2)
+        else:
+            found[priority] = _normalise_tax_year(from_year or tax_year, None)
+        # Stop as soon as the best remaining answer can't be beaten
+        for is_seen, year in zip(seen, found, strict=True):
+            if not is_seen:
+                break
+            if year is not None:
+                return year
+    return next((year for year in found if year is not None), None)
 
 
 def _build_metadata_prefix(page_title: str, section: ParsedSection) -> str:
@@ -3,12 +3,20 @@
 import asyncio
 import hashlib
 import logging
+from collections.abc import Callable
 from datetime import UTC, datetime
+from typing import Protocol
 
 import httpx
 
+from config.settings import settings
 from src.db.models import CrawlResult
 
+try:
+    import blake3
+except ImportError:  # optional: pip install blake3
+    blake3 = None
+
 logger = logging.getLogger(__name__)
 
 # Rate limit: 1 request per second
@@ -20,6 +28,29 @@ _DEFAULT_HEADERS = {
     "Accept-Language": "en-NZ,en;q=0.9",
 }
 
+_CONNECTION_LIMITS = httpx.Limits(
+    max_keepalive_connections=4, max_connections=8, keepalive_expiry=60.0
+)
+
+
+_STREAM_CHUNK_SIZE = 64 * 1024
+
+
+class _Hasher(Protocol):
+    def update(self, data: bytes, /) -> object: ...
+
+    def hexdigest(self) -> str: ...
+
+
+# Incremental content hashers by settings.content_hash_algo name. All produce
+# 32-byte digests so they fit the same content_hash column.
+_HASHERS: dict[str, Callable[[], _Hasher]] = {
+    "sha256": hashlib.sha256,
+    "blake2b": lambda: hashlib.blake2b(digest_size=32),
+}
+if blake3 is not None:
+    _HASHERS["blake3"] = blake3.blake3
+
 
 def _detect_content_type(response: httpx.Response, url: str) -> str:
     """Determine whether the response is HTML or PDF."""
@@ -34,17 +65,59 @@ def _detect_content_type(response: httpx.Response, url: str) -> str:
 class Crawler:
     """Async HTTP crawler with rate limiting."""
 
-    def __init__(self, rate_limit: float = _REQUEST_INTERVAL) -> None:
+    def __init__(
+        self, rate_limit: float = _REQUEST_INTERVAL, hash_algo: str | None = None
+    ) -> None:
+        hash_algo = hash_algo or settings.content_hash_algo
+        if hash_algo not in _HASHERS:
+            available = ", ".join(sorted(_HASHERS))
+            raise ValueError(f"Unsupported hash algorithm: {hash_algo}. Available: {available}")
+        self._hash_algo = hash_algo
+        self._new_hasher = _HASHERS[hash_algo]
         self._rate_limit = rate_limit
         self._last_request_time: float = 0.0
+        self._rate_lock = asyncio.Lock()
+        self._client: httpx.AsyncClient | None = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the shared client, creating it on first use.
+
+        Reusing one client keeps connections (and their TLS sessions) alive
+        across crawls of the same host.
+        """
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                headers=_DEFAULT_HEADERS,
+                follow_redirects=True,
+                timeout=30.0,
+                limits=_CONNECTION_LIMITS,
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
     async def _wait_for_rate_limit(self) -> None:
-        """Enforce minimum interval between requests."""
-        now = asyncio.get_event_loop().time()
-        elapsed = now - self._last_request_time
-        if elapsed < self._rate_limit:
-            await asyncio.sleep(self._rate_limit - elapsed)
-        self._last_request_time = asyncio.get_event_loop().time()
+        """Enforce minimum interval between requests.
+
+        Serialised with a lock so concurrent crawls still start one interval apart.
+        """
+        loop = asyncio.get_running_loop()
+        async with self._rate_lock:
+            now = loop.time()
+            wait = self._rate_limit - (now - self._last_request_time)
+            if wait > 0:
+                await asyncio.sleep(wait)
+                now = loop.time()
+            self._last_request_time = now
+
+    @property
+    def hash_algo(self) -> str:
+        """Name of the algorithm used for content hashes."""
+        return self._hash_algo
 
     async def crawl(self, url: str) -> CrawlResult:
         """Crawl a single URL and return the result with content hash.
@@ -53,7 +126,24 @@ class Crawler:
             url: The URL to crawl.
 
         Returns:
-            CrawlResult with content and SHA256 hash.
+            CrawlResult with content and its hash under the configured algorithm.
+
+        Raises:
+            httpx.HTTPStatusError: If the response status is 4xx/5xx.
+        """
+        result = await self.crawl_if_changed(url, None)
+        assert result is not None
+        return result
+
+    async def crawl_if_changed(self, url: str, known_hash: str | None) -> CrawlResult | None:
+        """Crawl a URL, skipping decoding if its content hash is unchanged.
+
+        Args:
+            url: The URL to crawl.
+            known_hash: Previously stored hash under the same algorithm, if any.
+
+        Returns:
+            CrawlResult, or None if the body hashes to ``known_hash``.
 
         Raises:
             httpx.HTTPStatusError: If the response status is 4xx/5xx.
@@ -61,32 +151,33 @@ class Crawler:
         await self._wait_for_rate_limit()
 
         logger.info("Crawling: %s", url)
-        async with httpx.AsyncClient(
-            headers=_DEFAULT_HEADERS,
-            follow_redirects=True,
-            timeout=30.0,
-        ) as client:
-            response = await client.get(url)
+        # Hash the body as it downloads; only HTML needs decoding for the parser
+        hasher = self._new_hasher()
+        parts: list[bytes] = []
+        async with self._get_client().stream("GET", url) as response:
             response.raise_for_status()
+            async for part in response.aiter_bytes(_STREAM_CHUNK_SIZE):
+                hasher.update(part)
+                parts.append(part)
+        body = b"".join(parts)
+        content_hash = hasher.hexdigest()
+        if content_hash == known_hash:
+            logger.info("Unchanged %s: hash=%s...", url, content_hash[:12])
+            return None
 
         content_type = _detect_content_type(response, url)
-
         if content_type == "pdf":
-            raw_bytes = response.content
-            content_hash = hashlib.sha256(raw_bytes).hexdigest()
+            raw_bytes: bytes | None = body
             html = ""
-            size = len(raw_bytes)
         else:
             raw_bytes = None
-            html = response.text
-            content_hash = hashlib.sha256(html.encode()).hexdigest()
-            size = len(html)
+            html = body.decode(response.encoding or "utf-8", errors="replace")
 
         logger.info(
             "Crawled %s: %s, %d bytes, hash=%s...",
             url,
             content_type,
-            size,
+            len(body),
             content_hash[:12],
         )
 
@@ -94,6 +185,7 @@ class Crawler:
             url=url,
             html=html,
             content_hash=content_hash,
+            hash_algo=self._hash_algo,
             status_code=response.status_code,
             crawled_at=datetime.now(UTC),
             raw_bytes=raw_bytes,
@@ -5,7 +5,9 @@ Handles bilingual titles, strips navigation/footer, splits on h2/h3 boundaries.
 """
 
 import logging
+from collections.abc import Iterator
 
+import soupsieve
 from bs4 import BeautifulSoup, NavigableString, Tag
 
 from src.db.models import ParsedDocument, ParsedSection
@@ -44,8 +46,16 @@ _STRIP_SELECTORS = [
     ".row-splitter",
 ]
 
-# Noise strings to filter from extracted text (IRD template artifacts)
-_NOISE_PATTERNS = {
+_SECTION_HEADINGS = frozenset({"h2", "h3"})
+_ALL_HEADINGS = frozenset({"h1", "h2", "h3", "h4", "h5", "h6"})
+
+# Compiled once at import; the strip list is one selector so the tree is scanned once
+_CONTENT_MATCHERS = [(selector, soupsieve.compile(selector)) for selector in _CONTENT_SELECTORS]
+_STRIP_MATCHER = soupsieve.compile(", ".join(_STRIP_SELECTORS))
+
+# Noise strings to filter from extracted text (IRD template artifacts). They
+# arrive as whole HTML comments, so an exact match per string is enough.
+_NOISE_PATTERNS = frozenset({
     "END NOINDEX",
     "START NOINDEX",
     "Start LeftHandNavigation",
@@ -56,7 +66,7 @@ _NOISE_PATTERNS = {
     "End MainContent",
     "Start KeyDateSummary",
     "End KeyDateSummary",
-}
+})
 
 
 def _extract_title(soup: BeautifulSoup) -> str:
@@ -94,8 +104,8 @@ def _extract_title(soup: BeautifulSoup) -> str:
 
 def _find_content_root(soup: BeautifulSoup) -> Tag:
     """Find the main content container using priority selectors."""
-    for selector in _CONTENT_SELECTORS:
-        element = soup.select_one(selector)
+    for selector, matcher in _CONTENT_MATCHERS:
+        element = matcher.select_one(soup)
         if element:
             logger.debug("Found content root: %s", selector)
             return element
@@ -109,8 +119,9 @@ def _find_content_root(soup: BeautifulSoup) -> Tag:
 
 def _strip_unwanted(root: Tag) -> None:
     """Remove navigation, footer, and other non-content elements in place."""
-    for selector in _STRIP_SELECTORS:
-        for element in root.select(selector):
+    for element in _STRIP_MATCHER.select(root):
+        # Matches come in document order; nested ones go with their ancestor
+        if not element.decomposed:
             element.decompose()
 
 
@@ -123,26 +134,23 @@ def _get_text_content(element: Tag) -> str:
     # Get text with separator for block elements
     text = element.get_text(separator="\n", strip=False)
 
-    # Clean up whitespace: collapse multiple spaces on each line, collapse multiple newlines
-    lines = []
-    for line in text.split("\n"):
-        cleaned = line.strip()
-        if cleaned:
-            lines.append(cleaned)
-
-    return "\n\n".join(lines)
+    # Strip every line and drop blank ones, leaving lines a blank line apart
+    return "\n\n".join(filter(None, map(str.strip, text.split("\n"))))
 
 
 def _extract_heading_text(heading: Tag) -> str:
     """Extract heading text, handling bilingual headings.
 
-    Removes aria-hidden spans (Māori text) and handles slash-separated titles.
+    Skips aria-hidden spans (Māori text) without modifying the tree and
+    handles slash-separated titles.
     """
-    # Remove aria-hidden spans before extracting text
-    for span in heading.find_all("span", attrs={"aria-hidden": "true"}):
-        span.decompose()
-
-    text = heading.get_text(strip=True)
+    hidden = {
+        id(string)
+        for span in heading.find_all("span", attrs={"aria-hidden": "true"})
+        for string in span.strings
+    }
+    stripped = (string.strip() for string in heading.strings if id(string) not in hidden)
+    text = "".join(part for part in stripped if part)
     if " / " in text:
         text = text.split(" / ")[0].strip()
     return text
@@ -183,92 +191,75 @@ def _collect_content_between(
     return "\n\n".join(parts)
 
 
+def _iter_content(element: Tag, in_heading: bool = False) -> Iterator[Tag | str]:
+    """Yield h2/h3 tags and stripped text in document order.
+
+    Text inside any heading (h1-h6) is skipped; noise strings are dropped.
+    Each h2/h3 is yielded before its own subtree is walked, so callers may
+    edit it in place.
+    """
+    for child in element.children:
+        if isinstance(child, NavigableString):
+            if not in_heading:
+                text = child.strip()
+                if text and text not in _NOISE_PATTERNS:
+                    yield text
+        elif isinstance(child, Tag):
+            if child.name in _SECTION_HEADINGS:
+                yield child
+            yield from _iter_content(child, in_heading or child.name in _ALL_HEADINGS)
+
+
 def _walk_sections(root: Tag) -> list[ParsedSection]:
     """Walk DOM tree, splitting on h2/h3 boundaries regardless of nesting depth.
 
-    Uses find_all to locate all h2/h3 headings in the tree, then collects
-    content between consecutive headings.
+    One document-order pass: text accumulates into the current section and
+    each h2/h3 starts a new one. Text before the first heading becomes
+    "Introduction".
     """
-    sections: list[ParsedSection] = []
+    intro_parts: list[str] = []
+    parts = intro_parts
+    headed: list[tuple[str, int, str | None, list[str]]] = []
+    current_h2: str | None = None
 
-    # Find all h2 and h3 headings anywhere in the tree
-    all_headings = root.find_all(["h2", "h3"])
+    # Text is skipped throughout if the root itself sits in a heading
+    in_heading = any(e.name in _ALL_HEADINGS for e in (root, *root.parents))
+    for item in _iter_content(root, in_heading):
+        if isinstance(item, str):
+            parts.append(item)
+            continue
+        heading_level = int(item.name[1])  # h2 -> 2, h3 -> 3
+        heading_text = _extract_heading_text(item)
+        if heading_level == 2:
+            current_h2 = heading_text
+        parts = []
+        headed.append(
+            (heading_text, heading_level, current_h2 if heading_level == 3 else None, parts)
+        )
 
-    if not all_headings:
+    sections: list[ParsedSection] = []
+    if not headed:
         # No headings — collect all content as a single section
         text = _get_text_content(root)
         if text:
-            sections.append(
-                ParsedSection(heading="Content", content=text, heading_level=2)
-            )
+            sections.append(ParsedSection(heading="Content", content=text, heading_level=2))
         return sections
 
-    # Collect content before the first heading as "Introduction"
-    intro_parts: list[str] = []
-    for element in root.descendants:
-        if element == all_headings[0]:
-            break
-        if isinstance(element, NavigableString):
-            # Only include if not inside a heading
-            parent_tags = {p.name for p in element.parents if isinstance(p, Tag)}
-            if not parent_tags & {"h1", "h2", "h3", "h4", "h5", "h6"}:
-                text = element.strip()
-                if text and text not in _NOISE_PATTERNS:
-                    intro_parts.append(text)
-
-    intro_text = "\n\n".join(intro_parts).strip()
+    intro_text = "\n\n".join(intro_parts)
     if intro_text:
         sections.append(
             ParsedSection(heading="Introduction", content=intro_text, heading_level=2)
         )
 
-    # Process each heading and its following content
-    current_h2: str | None = None
-
-    for i, heading in enumerate(all_headings):
-        heading_level = int(heading.name[1])  # h2 -> 2, h3 -> 3
-        heading_text = _extract_heading_text(heading)
-
-        if heading_level == 2:
-            current_h2 = heading_text
-
-        # Collect content between this heading and the next one
-        content_parts: list[str] = []
-        # Walk siblings and descendants after this heading until the next heading
-        next_heading = all_headings[i + 1] if i + 1 < len(all_headings) else None
-
-        # Walk all elements between this heading and the next
-        collecting = False
-        for element in root.descendants:
-            if element is heading:
-                collecting = True
-                continue
-            if next_heading and element is next_heading:
-                break
-            if not collecting:
-                continue
-
-            if isinstance(element, NavigableString):
-                # Skip text inside headings
-                parent_tags = {p.name for p in element.parents if isinstance(p, Tag)}
-                if parent_tags & {"h1", "h2", "h3", "h4", "h5", "h6"}:
-                    continue
-                text = element.strip()
-                if text and text not in _NOISE_PATTERNS:
-                    content_parts.append(text)
-
-        # Build clean content from collected text
+    for heading_text, heading_level, parent_heading, content_parts in headed:
         content = " ".join(content_parts)
-        # Re-add paragraph boundaries at sentence breaks for readability
-        content = content.strip()
-
         if content:
             sections.append(
                 ParsedSection(
                     heading=heading_text,
                     content=content,
                     heading_level=heading_level,
-                    parent_heading=current_h2 if heading_level == 3 else None,
+                    parent_heading=parent_heading,
                 )
             )
 
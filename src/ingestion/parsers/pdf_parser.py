@@ -7,7 +7,7 @@ via Q&A pattern detection or markdown heading detection.
 
 import logging
 import re
-from typing import Any
+from typing import Any, NamedTuple
 from urllib.parse import urlparse
 
 import pymupdf
@@ -20,17 +20,41 @@ logger = logging.getLogger(__name__)
 # Minimum Q&A matches to use Q&A sectioning
 _MIN_QA_MATCHES = 3
 
-# Patterns for Q&A-style sections in IRD guides
-_QA_PATTERNS = [
-    re.compile(r"^Question\s+(\d+)\b[.\s]*(.*)$", re.MULTILINE),
-    re.compile(r"^Q(\d+)[.:]\s*(.*)$", re.MULTILINE),
-]
+# Vector paths on a page above which pymupdf4llm skips graphics and table
+# analysis. Column detection is quadratic in the path count, and pages of
+# decorative vector art can otherwise take minutes each
+_GRAPHICS_LIMIT = 5000
+
+# Section markers in the markdown: Q&A headings in IRD guides ("Question 12
+# ..." or "Q12: ...") and markdown headings (# to ###). All three forms are
+# alternatives inside one zero-width lookahead so a single scan finds them,
+# and a match of one form may overlap a match of another. The [Q#] check
+# rejects ordinary lines before the alternation is tried.
+_SECTION_MARK_PATTERN = re.compile(
+    r"^(?=[Q#])(?=(Question\s+(\d+)\b[.\s]*(.*)$|Q(\d+)[.:]\s*(.*)$|(#{1,3})\s+(.+)$))",
+    re.MULTILINE,
+)
+
+
+class _SectionMarks(NamedTuple):
+    """Section markers found in a markdown document, each list in position order."""
+
+    qa: list[tuple[int, int, str]]  # (start, end, heading)
+    headings: list[tuple[int, int, int, str]]  # (start, end, level, raw heading)
+
+
+# Markdown bold/italic markers around heading text
+_BOLD_ITALIC_STARS = re.compile(r"\*{1,2}(.+?)\*{1,2}")
+_BOLD_ITALIC_UNDERSCORES = re.compile(r"_{1,2}(.+?)_{1,2}")
+
+# A line holding only a 1-3 digit number, matched with its preceding newline
+_PAGE_NUMBER_LINES = re.compile(r"\n[^\S\n]*\d{1,3}[^\S\n]*(?=\n|\Z)")
 
 
 def _strip_markdown_formatting(text: str) -> str:
     """Strip markdown bold/italic markers from text."""
-    text = re.sub(r'\*{1,2}(.+?)\*{1,2}', r'\1', text)
-    text = re.sub(r'_{1,2}(.+?)_{1,2}', r'\1', text)
+    text = _BOLD_ITALIC_STARS.sub(r"\1", text)
+    text = _BOLD_ITALIC_UNDERSCORES.sub(r"\1", text)
     return text.strip()
 
 
@@ -41,9 +65,10 @@ def _extract_title(doc: Any, url: str) -> str:
     if title:
         return title
 
-    # Try first page — look for largest text
+    # Try first page — look for largest text. TEXTFLAGS_TEXT is the "dict"
+    # default minus image preservation, so cover images aren't copied out.
     if len(doc) > 0:
-        blocks = doc[0].get_text("dict")["blocks"]
+        blocks = doc[0].get_text("dict", flags=pymupdf.TEXTFLAGS_TEXT)["blocks"]
         largest_size = 0.0
         largest_text = ""
         for block in blocks:
@@ -77,20 +102,49 @@ def _pdf_to_markdown(doc: Any) -> str:
         write_images=False,
         show_progress=False,
         margins=(0, 50, 0, 30),  # (left, top, right, bottom) — strip headers, light bottom clip
+        graphics_limit=_GRAPHICS_LIMIT,
     )
     return md_text
 
 
-def _markdown_to_sections(md_text: str) -> list[ParsedSection]:
+def _scan_section_marks(md_text: str) -> _SectionMarks:
+    """Find Q&A and markdown heading markers in a single pass."""
+    marks = _SectionMarks(qa=[], headings=[])
+    form_ends = [0, 0, 0]  # a form's matches don't overlap each other
+    for m in _SECTION_MARK_PATTERN.finditer(md_text):
+        if m.group(6) is not None:
+            form, num, rest = 2, "", ""
+        elif m.group(2) is not None:
+            form, num, rest = 0, m.group(2), m.group(3)
+        else:
+            form, num, rest = 1, m.group(4), m.group(5)
+        start = m.start()
+        if start < form_ends[form]:
+            continue
+        end = form_ends[form] = m.end(1)
+        if form == 2:
+            marks.headings.append((start, end, len(m.group(6)), m.group(7)))
+            continue
+        rest = rest.strip()
+        heading = f"Question {num}"
+        if rest:
+            heading = f"Question {num} {rest}"
+        marks.qa.append((start, end, heading))
+    return marks
+
+
+def _markdown_to_sections(
+    md_text: str, marks: _SectionMarks | None = None
+) -> list[ParsedSection]:
     """Split markdown text into sections based on heading markers.
 
     Tracks parent headings by level for hierarchical context.
     Falls back to a single "Content" section if no headings found.
+    Pass ``marks`` to reuse an earlier scan of the same text.
     """
-    # Split on markdown headings (# ## ###)
-    heading_pattern = re.compile(r"^(#{1,3})\s+(.+)$", re.MULTILINE)
-
-    matches = list(heading_pattern.finditer(md_text))
+    if marks is None:
+        marks = _scan_section_marks(md_text)
+    matches = marks.headings
     if not matches:
         content = md_text.strip()
         if content:
@@ -100,16 +154,15 @@ def _markdown_to_sections(md_text: str) -> list[ParsedSection]:
     sections: list[ParsedSection] = []
 
     # Content before first heading
-    intro_text = md_text[: matches[0].start()].strip()
+    intro_text = md_text[: matches[0][0]].strip()
     if intro_text:
         sections.append(ParsedSection(heading="Introduction", content=intro_text))
 
     # Track parent headings by level for hierarchical context
     parent_headings: dict[int, str] = {}
 
-    for i, match in enumerate(matches):
-        level = len(match.group(1))
-        heading = _strip_markdown_formatting(match.group(2).strip())
+    for i, (_start, end, level, raw_heading) in enumerate(matches):
+        heading = _strip_markdown_formatting(raw_heading.strip())
 
         # Update parent tracking
         parent_headings[level] = heading
@@ -123,9 +176,8 @@ def _markdown_to_sections(md_text: str) -> list[ParsedSection]:
             heading = f"{parent_headings[1]} > {heading}"
 
         # Extract content between this heading and the next
-        start = match.end()
-        end = matches[i + 1].start() if i + 1 < len(matches) else len(md_text)
-        content = md_text[start:end].strip()
+        next_start = matches[i + 1][0] if i + 1 < len(matches) else len(md_text)
+        content = md_text[end:next_start].strip()
 
         if content:
             sections.append(ParsedSection(heading=heading, content=content))
@@ -133,25 +185,18 @@ def _markdown_to_sections(md_text: str) -> list[ParsedSection]:
     return sections
 
 
-def _detect_qa_sections(md_text: str) -> list[ParsedSection] | None:
+def _detect_qa_sections(
+    md_text: str, marks: _SectionMarks | None = None
+) -> list[ParsedSection] | None:
     """Try to split markdown text into Q&A sections.
 
     Returns None if fewer than _MIN_QA_MATCHES are found, signaling
     the caller should fall back to heading-based detection.
+    Pass ``marks`` to reuse an earlier scan of the same text.
     """
-    # Find all Q&A pattern matches
-    qa_matches: list[tuple[int, int, str]] = []  # (start, end, heading)
-    for pattern in _QA_PATTERNS:
-        for m in pattern.finditer(md_text):
-            num = m.group(1)
-            rest = m.group(2).strip()
-            heading = f"Question {num}"
-            if rest:
-                heading = f"Question {num} {rest}"
-            qa_matches.append((m.start(), m.end(), heading))
-
-    # Sort by position and deduplicate (patterns may overlap)
-    qa_matches.sort(key=lambda x: x[0])
+    if marks is None:
+        marks = _scan_section_marks(md_text)
+    qa_matches = marks.qa
     if len(qa_matches) < _MIN_QA_MATCHES:
         return None
 
@@ -174,9 +219,9 @@ def _detect_qa_sections(md_text: str) -> list[ParsedSection] | None:
 
 def _clean_page_numbers(text: str) -> str:
     """Remove standalone page numbers (lines that are just a number)."""
-    lines = text.split("\n")
-    cleaned = [line for line in lines if not re.match(r"^\s*\d{1,3}\s*$", line)]
-    return "\n".join(cleaned)
+    # Each page-number line is removed with the newline before it; the
+    # leading newline gives the first line one too
+    return _PAGE_NUMBER_LINES.sub("", "\n" + text)[1:]
 
 
 def parse_pdf(pdf_bytes: bytes, url: str) -> ParsedDocument:
@@ -202,17 +247,20 @@ def parse_pdf(pdf_bytes: bytes, url: str) -> ParsedDocument:
     doc.close()
 
     # Strip null bytes — PyMuPDF can extract \x00 from some PDFs,
-    # and PostgreSQL rejects them in text fields
-    md_text = md_text.replace("\x00", "")
+    # and PostgreSQL rejects them in text fields. The probe is much cheaper
+    # than a replace that finds nothing, which is the usual case
+    if "\x00" in md_text:
+        md_text = md_text.replace("\x00", "")
 
     if not md_text.strip():
         logger.warning("No content extracted from PDF: %s", url)
         return ParsedDocument(title=title, url=url, sections=[])
 
     # Try Q&A sectioning first, fall back to markdown heading-based
-    sections = _detect_qa_sections(md_text)
+    marks = _scan_section_marks(md_text)
+    sections = _detect_qa_sections(md_text, marks)
     if sections is None:
-        sections = _markdown_to_sections(md_text)
+        sections = _markdown_to_sections(md_text, marks)
 
     # Clean page numbers from section content
     for section in sections:
@@ -9,8 +9,10 @@ Handles two page types:
 
 import logging
 import re
+from collections.abc import Iterator
 from urllib.parse import urljoin
 
+import soupsieve
 from bs4 import BeautifulSoup, NavigableString, Tag  # type: ignore[attr-defined]
 
 from src.db.models import ParsedDocument, ParsedSection
@@ -39,6 +41,17 @@ _STRIP_SELECTORS = [
     "noscript",
 ]
 
+# Compiled once, as in html_parser
+_CONTENT_MATCHERS = [(selector, soupsieve.compile(selector)) for selector in _CONTENT_SELECTORS]
+_STRIP_MATCHER = soupsieve.compile(", ".join(_STRIP_SELECTORS))
+
+# Metadata lines near the top of an article
+_REFERENCE_RE = re.compile(r"Reference:\s*(.+)")
+_ISSUED_RE = re.compile(r"Issued:\s*(.+)")
+
+_SECTION_HEADINGS = frozenset({"h2", "h3"})
+_HEADING_NAMES = frozenset({"h1", "h2", "h3", "h4", "h5", "h6"})
+
 # Stub detection: if body text is below this word count and a PDF link exists,
 # treat the page as a stub.
 _STUB_WORD_THRESHOLD = 300
@@ -66,8 +79,8 @@ def _extract_title(soup: BeautifulSoup) -> str:
 
 def _find_content_root(soup: BeautifulSoup) -> Tag:
     """Find the main content container."""
-    for selector in _CONTENT_SELECTORS:
-        element = soup.select_one(selector)
+    for selector, matcher in _CONTENT_MATCHERS:
+        element = matcher.select_one(soup)
         if element:
             logger.debug("Found content root: %s", selector)
             return element
@@ -81,8 +94,9 @@ def _find_content_root(soup: BeautifulSoup) -> Tag:
 
 def _strip_unwanted(root: Tag) -> None:
     """Remove navigation, footer, and other non-content elements."""
-    for selector in _STRIP_SELECTORS:
-        for element in root.select(selector):
+    for element in _STRIP_MATCHER.select(root):
+        # Already gone if an enclosing match was removed first
+        if not element.decomposed:
             element.decompose()
 
 
@@ -95,11 +109,11 @@ def _extract_metadata(root: Tag) -> ParsedSection | None:
     text = root.get_text(separator="\n")
     lines: list[str] = []
 
-    ref_match = re.search(r"Reference:\s*(.+)", text)
+    ref_match = _REFERENCE_RE.search(text)
     if ref_match:
         lines.append(f"Reference: {ref_match.group(1).strip()}")
 
-    date_match = re.search(r"Issued:\s*(.+)", text)
+    date_match = _ISSUED_RE.search(text)
     if date_match:
         lines.append(f"Issued: {date_match.group(1).strip()}")
 
@@ -136,81 +150,75 @@ def _count_body_words(root: Tag) -> int:
     return word_count
 
 
+def _iter_content(element: Tag, in_heading: bool = False) -> Iterator[Tag | str]:
+    """Yield h2/h3 tags and stripped non-empty text in document order.
+
+    Text inside any heading (h1-h6) is skipped.
+    """
+    for child in element.children:
+        if isinstance(child, NavigableString):
+            if not in_heading:
+                text = child.strip()
+                if text:
+                    yield text
+        elif isinstance(child, Tag):
+            if child.name in _SECTION_HEADINGS:
+                yield child
+            yield from _iter_content(child, in_heading or child.name in _HEADING_NAMES)
+
+
 def _walk_sections(root: Tag) -> list[ParsedSection]:
     """Walk DOM tree, splitting on h2/h3 boundaries.
 
-    Same flat find_all approach as html_parser but without bilingual heading
+    Same single-pass approach as html_parser but without bilingual heading
     handling or NOINDEX noise filtering.
     """
-    sections: list[ParsedSection] = []
-    all_headings = root.find_all(["h2", "h3"])
+    intro_parts: list[str] = []
+    parts = intro_parts
+    headed: list[tuple[str, int, str | None, list[str]]] = []
+    current_h2: str | None = None
+
+    # Text is skipped throughout if the root itself sits in a heading
+    in_heading = any(e.name in _HEADING_NAMES for e in (root, *root.parents))
+    for item in _iter_content(root, in_heading):
+        if isinstance(item, str):
+            parts.append(item)
+            continue
+        heading_level = int(item.name[1])
+        heading_text = item.get_text(strip=True)
+        if heading_level == 2:
+            current_h2 = heading_text
+        parts = []
+        headed.append(
+            (heading_text, heading_level, current_h2 if heading_level == 3 else None, parts)
+        )
 
-    if not all_headings:
+    sections: list[ParsedSection] = []
+    if not headed:
         text = _get_text_content(root)
         if text:
-            sections.append(
-                ParsedSection(heading="Content", content=text, heading_level=2)
-            )
+            sections.append(ParsedSection(heading="Content", content=text, heading_level=2))
         return sections
 
-    # Collect content before the first heading as "Introduction"
-    intro_parts: list[str] = []
-    for element in root.descendants:
-        if element == all_headings[0]:
-            break
-        if isinstance(element, NavigableString):
-            parent_tags = {p.name for p in element.parents if isinstance(p, Tag)}
-            if not parent_tags & {"h1", "h2", "h3", "h4", "h5", "h6"}:
-                text = element.strip()
-                if text and not text.startswith(("Reference:", "Issued:")):
-                    intro_parts.append(text)
-
-    intro_text = "\n\n".join(intro_parts).strip()
+    # Content before the first heading is the introduction; metadata lines
+    # are reported separately
+    intro_text = "\n\n".join(
+        text for text in intro_parts if not text.startswith(("Reference:", "Issued:"))
+    )
     if intro_text:
         sections.append(
             ParsedSection(heading="Introduction", content=intro_text, heading_level=2)
         )
 
-    # Process each heading and its following content
-    current_h2: str | None = None
-
-    for i, heading in enumerate(all_headings):
-        heading_level = int(heading.name[1])
-        heading_text = heading.get_text(strip=True)
-
-        if heading_level == 2:
-            current_h2 = heading_text
-
-        # Collect content between this heading and the next
-        next_heading = all_headings[i + 1] if i + 1 < len(all_headings) else None
-        content_parts: list[str] = []
-        collecting = False
-
-        for element in root.descendants:
-            if element is heading:
-                collecting = True
-                continue
-            if next_heading and element is next_heading:
-                break
-            if not collecting:
-                continue
-
-            if isinstance(element, NavigableString):
-                parent_tags = {p.name for p in element.parents if isinstance(p, Tag)}
-                if parent_tags & {"h1", "h2", "h3", "h4", "h5", "h6"}:
-                    continue
-                text = element.strip()
-                if text:
-                    content_parts.append(text)
-
-        content = " ".join(content_parts).strip()
+    for heading_text, heading_level, parent_heading, content_parts in headed:
+        content = " ".join(content_parts)
         if content:
             sections.append(
                 ParsedSection(
                     heading=heading_text,
                     content=content,
                     heading_level=heading_level,
-                    parent_heading=current_h2 if heading_level == 3 else None,
+                    parent_heading=parent_heading,
                 )
             )
 
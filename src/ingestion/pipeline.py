@@ -5,11 +5,19 @@ Supports upsert semantics with content hash change detection.
 """
 
 import asyncio
+import hashlib
+import inspect
 import logging
+from collections.abc import Awaitable, Callable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, date, datetime
+from importlib.metadata import version
+from pathlib import Path
 
 import asyncpg
+from pydantic import ValidationError
 
+from src._batch_queue import BatchQueue
 from src.db.models import ChunkData, CrawlResult, ParsedDocument
 from src.db.session import get_pool
 from src.ingestion.chunker import chunk_document
@@ -23,6 +31,100 @@ logger = logging.getLogger(__name__)
 
 # Batch size for embedding API calls
 _EMBED_BATCH_SIZE = 20
+# Embedding batches in flight at once, across all documents
+_EMBED_CONCURRENCY = 4
+# A batch is sent once it holds _EMBED_BATCH_SIZE texts or _EMBED_BATCH_WAIT
+# seconds after its first text, whichever comes first
+_EMBED_BATCH_WAIT = 0.05
+
+
+def _parser_version() -> str:
+    """Fingerprint the code that turns content into chunks.
+
+    Covers the parser, chunker and model sources plus the pymupdf4llm
+    release, so cached parses expire by themselves whenever any of them
+    changes.
+    """
+    digest = hashlib.sha256(version("pymupdf4llm").encode())
+    for obj in (parse_html, parse_pdf, parse_taxtechnical, chunk_document, ParsedDocument):
+        digest.update(Path(inspect.getfile(obj)).read_bytes())
+    return digest.hexdigest()[:16]
+
+
+_PARSER_VERSION = _parser_version()
+
+# PyMuPDF doesn't support multithreaded use, so PDFs from concurrent ingests
+# are parsed one at a time on a single dedicated thread
+_PDF_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pdf-parse")
+
+
+async def _parse_pdf_off_loop(pdf_bytes: bytes, url: str) -> ParsedDocument:
+    """Parse a PDF on the PDF thread, keeping the event loop free for other ingests."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_PDF_EXECUTOR, parse_pdf, pdf_bytes, url)
+
+
+_CHUNK_COLUMNS = [
+    "source_id", "chunk_index", "content", "section_title", "tax_year", "embedding",
+    "search_vector",
+]
+
+# Per-connection staging table for COPY; rows are cleared when the transaction ends
+_CREATE_CHUNK_STAGING_SQL = """
+    CREATE TEMP TABLE IF NOT EXISTS chunk_staging (
+        source_id     UUID,
+        chunk_index   INTEGER,
+        content       TEXT,
+        section_title TEXT,
+        tax_year      TEXT,
+        embedding     halfvec(768),
+        search_vector TEXT
+    ) ON COMMIT DELETE ROWS
+"""
+
+
+class _EmbeddingBatcher:
+    """Queue of chunk texts from every document, embedded in shared batches.
+
+    Documents ingested concurrently fill each other's batches instead of
+    each sending its own partial batch.
+    """
+
+    def __init__(self, embed_batch: Callable[[list[str]], Awaitable[list[list[float]]]]) -> None:
+        self._embed_batch = embed_batch
+        # Batches are sent concurrently; embed_batch's semaphore bounds them
+        self._texts = BatchQueue(
+            self._send, max_items=_EMBED_BATCH_SIZE, max_wait=_EMBED_BATCH_WAIT, concurrent=True
+        )
+
+    async def embed(self, texts: list[str]) -> list[list[float]]:
+        """Queue texts for embedding and wait for their vectors, in order."""
+        loop = asyncio.get_running_loop()
+        futures = [loop.create_future() for _ in texts]
+        for text, future in zip(texts, futures, strict=True):
+            await self._texts.put((text, future))
+        # Collect every outcome so a failed batch doesn't leave unretrieved errors
+        results = await asyncio.gather(*futures, return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        return results  # type: ignore[return-value]
+
+    async def close(self) -> None:
+        """Embed any queued texts, then stop the collector task."""
+        await self._texts.close()
+
+    async def _send(self, batch: list[tuple[str, asyncio.Future[list[float]]]]) -> None:
+        try:
+            embeddings = await self._embed_batch([text for text, _ in batch])
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (_, future), embedding in zip(batch, embeddings, strict=True):
+            if not future.done():
+                future.set_result(embedding)
 
 
 class IngestionPipeline:
@@ -31,50 +133,159 @@ class IngestionPipeline:
     def __init__(self, embedder: GeminiEmbedder, crawler: Crawler | None = None) -> None:
         self.embedder = embedder
         self.crawler = crawler or Crawler()
+        # Shared across documents so concurrent ingests stay within the bound
+        self._embed_semaphore = asyncio.Semaphore(_EMBED_CONCURRENCY)
+        self._embed_batcher = _EmbeddingBatcher(self._embed_batch)
+
+    async def aclose(self) -> None:
+        """Finish queued embedding work and stop the background batcher."""
+        await self._embed_batcher.close()
 
     async def _get_existing_hash(
-        self, pool: asyncpg.Pool, url: str
+        self, pool: asyncpg.Pool, url: str, hash_algo: str
     ) -> str | None:
-        """Get the content hash for an existing source URL."""
+        """Get the hex content hash for an existing source URL.
+
+        Hashes made with a different algorithm aren't comparable, so they
+        count as missing.
+        """
+        row = await pool.fetchrow(
+            "SELECT content_hash FROM document_sources WHERE url = $1 AND hash_algo = $2",
+            url,
+            hash_algo,
+        )
+        if row is None or row["content_hash"] is None:
+            return None
+        # Stored as raw bytea; CrawlResult hashes are hex strings
+        return bytes(row["content_hash"]).hex()
+
+    async def _get_cached_parse(
+        self, pool: asyncpg.Pool, url: str, crawl_result: CrawlResult
+    ) -> tuple[ParsedDocument, list[ChunkData]] | None:
+        """Load the parsed document and chunks cached for this exact content, if any."""
         row = await pool.fetchrow(
-            "SELECT content_hash FROM document_sources WHERE url = $1",
+            """
+            SELECT parsed, chunks FROM parsed_document_cache
+            WHERE url = $1 AND content_hash = $2 AND hash_algo = $3 AND parser_version = $4
+            """,
+            url,
+            bytes.fromhex(crawl_result.content_hash),
+            crawl_result.hash_algo,
+            _PARSER_VERSION,
+        )
+        if row is None:
+            return None
+        try:
+            parsed = ParsedDocument.model_validate(row["parsed"])
+            chunks = [ChunkData.model_validate(c) for c in row["chunks"]]
+        except ValidationError:
+            logger.warning("Ignoring unreadable cached parse for %s", url)
+            return None
+        return parsed, chunks
+
+    async def _cache_parse(
+        self,
+        pool: asyncpg.Pool,
+        url: str,
+        crawl_result: CrawlResult,
+        parsed: ParsedDocument,
+        chunks: list[ChunkData],
+    ) -> None:
+        """Cache a parse so a retry or forced re-ingest of the same content skips it."""
+        await pool.execute(
+            """
+            INSERT INTO parsed_document_cache
+                (url, content_hash, hash_algo, parser_version, parsed, chunks)
+            VALUES ($1, $2, $3, $4, $5, $6)
+            ON CONFLICT (url) DO UPDATE SET
+                content_hash = EXCLUDED.content_hash,
+                hash_algo = EXCLUDED.hash_algo,
+                parser_version = EXCLUDED.parser_version,
+                parsed = EXCLUDED.parsed,
+                chunks = EXCLUDED.chunks,
+                created_at = NOW()
+            """,
             url,
+            bytes.fromhex(crawl_result.content_hash),
+            crawl_result.hash_algo,
+            _PARSER_VERSION,
+            parsed.model_dump(),
+            [c.model_dump() for c in chunks],
         )
-        return row["content_hash"] if row else None
 
-    async def _embed_chunks(self, chunks: list[ChunkData]) -> list[list[float]]:
-        """Embed all chunks in batches with rate-limit retry."""
-        all_embeddings: list[list[float]] = []
-        texts = [c.content for c in chunks]
-
-        for i in range(0, len(texts), _EMBED_BATCH_SIZE):
-            batch = texts[i : i + _EMBED_BATCH_SIZE]
-            # Retry with exponential backoff on rate limit errors
-            for attempt in range(4):
+    async def _parse(self, url: str, crawl_result: CrawlResult) -> ParsedDocument | None:
+        """Parse crawled content with the parser for its type and source.
+
+        Follows a PDF link if the parser detected one (e.g. taxtechnical stub
+        pages). Returns None if a PDF crawl came back without its bytes.
+        """
+        if crawl_result.content_type == "pdf":
+            if crawl_result.raw_bytes is None:
+                logger.error("PDF crawl result missing raw_bytes: %s", url)
+                return None
+            parsed: ParsedDocument = await _parse_pdf_off_loop(crawl_result.raw_bytes, url)
+        elif "taxtechnical.ird.govt.nz" in url:
+            parsed = parse_taxtechnical(crawl_result.html, url)
+        else:
+            parsed = parse_html(crawl_result.html, url)
+
+        if parsed.pdf_url:
+            logger.info("Following PDF link: %s", parsed.pdf_url)
+            pdf_crawl = await self.crawler.crawl(parsed.pdf_url)
+            if pdf_crawl.content_type == "pdf" and pdf_crawl.raw_bytes:
+                pdf_parsed = await _parse_pdf_off_loop(pdf_crawl.raw_bytes, url)
+                parsed = ParsedDocument(
+                    title=parsed.title,
+                    url=url,
+                    sections=parsed.sections + pdf_parsed.sections,
+                    pdf_url=parsed.pdf_url,
+                )
+        return parsed
+
+    async def _compute_search_vectors(
+        self, pool: asyncpg.Pool, texts: list[str]
+    ) -> list[str]:
+        """Build full-text search vectors for chunk texts outside the write transaction.
+
+        Returns tsvectors in their text form, in the same order as ``texts``.
+        """
+        rows = await pool.fetch(
+            """
+            SELECT to_tsvector('english', t.content)::text AS search_vector
+            FROM unnest($1::text[]) WITH ORDINALITY AS t(content, ord)
+            ORDER BY t.ord
+            """,
+            texts,
+        )
+        return [r["search_vector"] for r in rows]
+
+    async def _embed_batch(self, batch: list[str]) -> list[list[float]]:
+        """Embed one batch, retrying with exponential backoff on rate limit errors.
+
+        A batch keeps its concurrency slot while backing off, so a rate-limited
+        pipeline slows down rather than piling on more requests.
+        """
+        async with self._embed_semaphore:
+            for attempt in range(1, 4):
                 try:
-                    embeddings = await self.embedder.embed_documents(batch)
-                    break
+                    return await self.embedder.embed_documents(batch)
                 except Exception as e:
-                    if "429" in str(e) and attempt < 3:
-                        wait = 5 * (attempt + 1)  # 5, 10, 15 seconds
-                        logger.warning("Rate limited, retrying in %ds...", wait)
-                        await asyncio.sleep(wait)
-                    else:
+                    if "429" not in str(e):
                         raise
-            all_embeddings.extend(embeddings)
-            logger.info(
-                "Embedded batch %d-%d of %d",
-                i,
-                min(i + _EMBED_BATCH_SIZE, len(texts)),
-                len(texts),
-            )
-            # Delay between batches to avoid Gemini API rate limits
-            # Longer delay for large documents (>100 chunks)
-            if i + _EMBED_BATCH_SIZE < len(texts):
-                delay = 4.0 if len(texts) > 100 else 1.0
-                await asyncio.sleep(delay)
+                    wait = 5 * attempt  # 5, 10, 15 seconds
+                    logger.warning("Rate limited, retrying in %ds...", wait)
+                    await asyncio.sleep(wait)
+            return await self.embedder.embed_documents(batch)
 
-        return all_embeddings
+    async def _embed_chunks(self, chunks: list[ChunkData]) -> list[list[float]]:
+        """Embed all chunks, preserving chunk order.
+
+        Chunks go through the shared batcher, so they may ride in batches
+        with chunks from other documents being ingested at the same time.
+        """
+        embeddings = await self._embed_batcher.embed([c.content for c in chunks])
+        logger.info("Embedded %d chunks", len(embeddings))
+        return embeddings
 
     async def _store_chunks(
         self,
@@ -82,10 +293,14 @@ class IngestionPipeline:
         source_id: str,
         chunks: list[ChunkData],
         embeddings: list[list[float]],
+        search_vectors: list[str],
     ) -> int:
         """Store chunks in database within an existing transaction.
 
-        Deletes old chunks for this source, then inserts new ones.
+        Deletes old chunks for this source, then bulk-loads new ones with a
+        binary COPY. tsvector has no binary COPY encoder in asyncpg, so rows
+        are staged with the search vector as text and moved across with a
+        single INSERT ... SELECT that casts it (a parse, not re-stemming).
         Returns number of chunks inserted.
         """
         # Delete existing chunks for this source
@@ -94,21 +309,35 @@ class IngestionPipeline:
             source_id,
         )
 
-        # Insert new chunks
-        for chunk, embedding in zip(chunks, embeddings, strict=True):
-            await conn.execute(
-                """
-                INSERT INTO document_chunks
-                    (source_id, chunk_index, content, section_title, tax_year, embedding)
-                VALUES ($1::uuid, $2, $3, $4, $5, $6)
-                """,
-                source_id,
-                chunk.chunk_index,
-                chunk.content,
-                chunk.section_title,
-                chunk.tax_year,
-                embedding,
-            )
+        await conn.execute(_CREATE_CHUNK_STAGING_SQL)
+        await conn.copy_records_to_table(
+            "chunk_staging",
+            records=[
+                (
+                    source_id,
+                    chunk.chunk_index,
+                    chunk.content,
+                    chunk.section_title,
+                    chunk.tax_year,
+                    embedding,
+                    search_vector,
+                )
+                for chunk, embedding, search_vector in zip(
+                    chunks, embeddings, search_vectors, strict=True
+                )
+            ],
+            columns=_CHUNK_COLUMNS,
+        )
+        await conn.execute(
+            """
+            INSERT INTO document_chunks
+                (source_id, chunk_index, content, section_title, tax_year, embedding,
+                 search_vector)
+            SELECT source_id, chunk_index, content, section_title, tax_year, embedding,
+                   search_vector::tsvector
+            FROM chunk_staging
+            """
+        )
 
         return len(chunks)
 
@@ -121,16 +350,19 @@ class IngestionPipeline:
         content_hash: str,
         identifier: str | None = None,
         issue_date: date | None = None,
+        hash_algo: str = "sha256",
     ) -> str:
         """Insert or update a document source. Returns the source ID."""
         row = await conn.fetchrow(
             """
             INSERT INTO document_sources
-                (url, source_type, title, content_hash, last_crawled_at, identifier, issue_date)
-            VALUES ($1, $2, $3, $4, $5, $6, $7)
+                (url, source_type, title, content_hash, last_crawled_at, identifier, issue_date,
+                 hash_algo)
+            VALUES ($1, $2, $3, $4, $5, $6, $7, $8)
             ON CONFLICT (url) DO UPDATE SET
                 title = EXCLUDED.title,
                 content_hash = EXCLUDED.content_hash,
+                hash_algo = EXCLUDED.hash_algo,
                 last_crawled_at = EXCLUDED.last_crawled_at,
                 identifier = COALESCE(EXCLUDED.identifier, document_sources.identifier),
                 issue_date = COALESCE(EXCLUDED.issue_date, document_sources.issue_date),
@@ -140,10 +372,11 @@ class IngestionPipeline:
             url,
             source_type,
             title,
-            content_hash,
+            bytes.fromhex(content_hash),
             datetime.now(UTC),
             identifier,
             issue_date,
+            hash_algo,
         )
         return str(row["id"])
 
@@ -173,43 +406,31 @@ class IngestionPipeline:
         """
         pool = await get_pool()
 
-        # Crawl
-        crawl_result: CrawlResult = await self.crawler.crawl(url)
-
-        # Check for changes
-        if not force:
-            existing_hash = await self._get_existing_hash(pool, url)
-            if existing_hash == crawl_result.content_hash:
-                logger.info("Skipping %s (content unchanged)", url)
-                return {"url": url, "skipped": True, "reason": "content unchanged"}
-
-        # Parse
-        if crawl_result.content_type == "pdf":
-            if crawl_result.raw_bytes is None:
-                logger.error("PDF crawl result missing raw_bytes: %s", url)
+        # Crawl, skipping parse when the stored hash still matches
+        existing_hash = (
+            None if force else await self._get_existing_hash(pool, url, self.crawler.hash_algo)
+        )
+        crawl_result: CrawlResult | None = await self.crawler.crawl_if_changed(url, existing_hash)
+        if crawl_result is None:
+            logger.info("Skipping %s (content unchanged)", url)
+            return {"url": url, "skipped": True, "reason": "content unchanged"}
+
+        # Parse and chunk, reusing the cached result for this exact content
+        cached = await self._get_cached_parse(pool, url, crawl_result)
+        if cached is None:
+            parsed = await self._parse(url, crawl_result)
+            if parsed is None:
                 return {"url": url, "skipped": True, "reason": "missing PDF bytes"}
-            parsed: ParsedDocument = parse_pdf(crawl_result.raw_bytes, url)
-        elif "taxtechnical.ird.govt.nz" in url:
-            parsed = parse_taxtechnical(crawl_result.html, url)
+            chunks = chunk_document(parsed)
+            # The content hash only covers this page, not a PDF it links to,
+            # so documents that pulled in a PDF aren't cached
+            if chunks and not dry_run and parsed.pdf_url is None:
+                await self._cache_parse(pool, url, crawl_result, parsed, chunks)
         else:
-            parsed = parse_html(crawl_result.html, url)
+            logger.info("Using cached parse for %s", url)
+            parsed, chunks = cached
         page_title = title or parsed.title
 
-        # Follow PDF link if the parser detected one (e.g. taxtechnical stub pages)
-        if parsed.pdf_url:
-            logger.info("Following PDF link: %s", parsed.pdf_url)
-            pdf_crawl = await self.crawler.crawl(parsed.pdf_url)
-            if pdf_crawl.content_type == "pdf" and pdf_crawl.raw_bytes:
-                pdf_parsed = parse_pdf(pdf_crawl.raw_bytes, url)
-                parsed = ParsedDocument(
-                    title=parsed.title,
-                    url=url,
-                    sections=parsed.sections + pdf_parsed.sections,
-                )
-
-        # Chunk
-        chunks: list[ChunkData] = chunk_document(parsed)
-
         if not chunks:
             logger.warning("No chunks produced for %s", url)
             return {"url": url, "skipped": True, "reason": "no chunks produced"}
@@ -229,16 +450,22 @@ class IngestionPipeline:
                 "title": page_title,
             }
 
-        # Embed
-        embeddings = await self._embed_chunks(chunks)
+        # Embed, and build search vectors on the DB while the embedding API works
+        embeddings, search_vectors = await asyncio.gather(
+            self._embed_chunks(chunks),
+            self._compute_search_vectors(pool, [c.content for c in chunks]),
+        )
 
         # Store atomically
         async with pool.acquire() as conn, conn.transaction():
                 source_id = await self._upsert_source(
                     conn, url, source_type, page_title, crawl_result.content_hash,
                     identifier=identifier, issue_date=issue_date,
+                    hash_algo=crawl_result.hash_algo,
+                )
+                stored = await self._store_chunks(
+                    conn, source_id, chunks, embeddings, search_vectors
                 )
-                stored = await self._store_chunks(conn, source_id, chunks, embeddings)
 
         logger.info(
             "Processed %s: %d sections, %d chunks stored",
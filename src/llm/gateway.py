@@ -27,6 +27,20 @@ class LLMGateway:
     def __init__(self, model: str | None = None) -> None:
         self.model = model or settings.llm_default_model
 
+    async def warmup(self) -> None:
+        """Send a one-token completion to open the provider connection early.
+
+        Failures are logged, not raised.
+        """
+        try:
+            await litellm.acompletion(
+                model=self.model,
+                messages=[{"role": "user", "content": "ping"}],
+                max_tokens=1,
+            )
+        except Exception as e:
+            logger.warning("LLM warmup failed for %s: %s", self.model, e)
+
     async def complete(
         self,
         messages: list[dict[str, Any]],
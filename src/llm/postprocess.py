@@ -56,8 +56,9 @@ def linkify_bare_urls(answer: str, sources: list[SourceReference]) -> str:
     return _BARE_URL_RE.sub(_replace_url, answer)
 
 
-# Matches markdown links: [text](url)
-_MARKDOWN_LINK_RE = re.compile(r"\[.+?\]\(https?://[^\s)]+\)")
+# Matches markdown links: [text](url). The bounded negated class for the link
+# text can't backtrack across the answer the way a lazy .+? can.
+_MARKDOWN_LINK_RE = re.compile(r"\[[^\]\n]{1,200}\]\(https?://[^\s)]+\)", re.ASCII)
 
 
 def ensure_citations(answer: str, sources: list[SourceReference]) -> str:
@@ -16,6 +16,9 @@ logger = logging.getLogger(__name__)
 # Module-level LRU cache for query embeddings (sync wrapper stores results)
 _EMBED_CACHE_SIZE = 256
 
+# Max texts per embed_content request when batching queries
+_QUERY_BATCH_SIZE = 100
+
 
 class GeminiEmbedder:
     """Embed text using Gemini's embedding model via the google-genai SDK."""
@@ -34,6 +37,23 @@ class GeminiEmbedder:
         self._query_cache: dict[str, list[float]] = {}
         self._cache_max = _EMBED_CACHE_SIZE
 
+    async def warmup(self) -> None:
+        """Send one tiny embedding request to open the HTTP connection early.
+
+        The result is discarded and not cached. Failures are logged, not raised.
+        """
+        try:
+            await self.client.aio.models.embed_content(
+                model=self.model,
+                contents="ping",
+                config=types.EmbedContentConfig(
+                    task_type=self._task_type_query,
+                    output_dimensionality=self.dimensions,
+                ),
+            )
+        except Exception as e:
+            logger.warning("Embedder warmup failed: %s", e)
+
     async def embed_documents(self, texts: list[str]) -> list[list[float]]:
         """Embed a batch of document chunks for storage.
 
@@ -81,11 +101,45 @@ class GeminiEmbedder:
             ),
         )
         embedding = result.embeddings[0].values
+        self._cache_query(text, embedding)
+
+        return embedding
+
+    async def embed_queries(self, texts: list[str]) -> list[list[float]]:
+        """Embed several search queries with as few API requests as possible.
 
-        # Evict oldest entries if cache is full
+        Cached queries are served from memory; the rest are sent in batched
+        requests and added to the cache.
+
+        Args:
+            texts: Query texts to embed.
+
+        Returns:
+            Embedding vectors in the same order as ``texts``.
+        """
+        # Snapshot hits first: new entries below may evict them from the cache
+        embedded = {t: self._query_cache[t] for t in texts if t in self._query_cache}
+        missing = list(dict.fromkeys(t for t in texts if t not in embedded))
+
+        for i in range(0, len(missing), _QUERY_BATCH_SIZE):
+            batch = missing[i : i + _QUERY_BATCH_SIZE]
+            result = await self.client.aio.models.embed_content(
+                model=self.model,
+                contents=batch,
+                config=types.EmbedContentConfig(
+                    task_type=self._task_type_query,
+                    output_dimensionality=self.dimensions,
+                ),
+            )
+            for text, e in zip(batch, result.embeddings, strict=True):
+                embedded[text] = e.values
+                self._cache_query(text, e.values)
+
+        return [embedded[t] for t in texts]
+
+    def _cache_query(self, text: str, embedding: list[float]) -> None:
+        """Store a query embedding, evicting the oldest entry if the cache is full."""
         if len(self._query_cache) >= self._cache_max:
             oldest_key = next(iter(self._query_cache))
             del self._query_cache[oldest_key]
         self._query_cache[text] = embedding
-
-        return embedding
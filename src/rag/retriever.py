@@ -8,6 +8,7 @@ from typing import TYPE_CHECKING
 import asyncpg
 import numpy as np
 
+from config.settings import settings
 from src.db.models import RetrievalResult
 from src.rag.embedder import GeminiEmbedder
 
@@ -19,6 +20,11 @@ logger = logging.getLogger(__name__)
 # RRF constant — standard value from the original paper
 _RRF_K = 60
 
+# Tax years covered by the partial HNSW index idx_chunks_embedding_current
+# (migration 0010). Keep in sync with the index predicate.
+_PARTIAL_INDEX_TAX_YEARS = ("2024-25", "2025-26")
+_PARTIAL_INDEX_PREDICATE = f"c.tax_year IN ({', '.join(map(repr, _PARTIAL_INDEX_TAX_YEARS))})"
+
 
 class HybridRetriever:
     """Two-query hybrid search over document_chunks with RRF fusion."""
@@ -28,10 +34,14 @@ class HybridRetriever:
         pool: asyncpg.Pool,
         embedder: GeminiEmbedder,
         reranker: CrossEncoderReranker | None = None,
+        ef_search: int | None = None,
     ) -> None:
         self._pool = pool
         self._embedder = embedder
         self._reranker = reranker
+        self._ef_search = int(ef_search or settings.hnsw_ef_search)
+        # None until probed; False on pgvector < 0.8 (no iterative index scans)
+        self._iterative_scan: bool | None = None
 
     async def search(
         self,
@@ -48,6 +58,34 @@ class HybridRetriever:
             source_type: Optional filter by document source type.
             tax_year: Optional filter by tax year.
 
+        Returns:
+            Ranked list of RetrievalResult.
+        """
+        query_embedding = await self._embedder.embed_query(query)
+        return await self.search_by_vector(
+            query, query_embedding, top_k=top_k, source_type=source_type, tax_year=tax_year
+        )
+
+    async def search_by_vector(
+        self,
+        query: str,
+        query_embedding: list[float],
+        top_k: int = 5,
+        source_type: str | None = None,
+        tax_year: str | None = None,
+    ) -> list[RetrievalResult]:
+        """Run hybrid search with a precomputed query embedding.
+
+        Lets callers embed many queries in one batch request. The query text
+        is still needed for keyword search and reranking.
+
+        Args:
+            query: User's natural-language question.
+            query_embedding: Embedding of ``query`` (RETRIEVAL_QUERY task type).
+            top_k: Number of results to return.
+            source_type: Optional filter by document source type.
+            tax_year: Optional filter by tax year.
+
         Returns:
             Ranked list of RetrievalResult.
         """
@@ -55,8 +93,6 @@ class HybridRetriever:
         fetch_multiplier = 4 if self._reranker else 3
         fetch_k = top_k * fetch_multiplier
 
-        query_embedding = await self._embedder.embed_query(query)
-
         async with self._pool.acquire() as conn:
             semantic_rows = await self._semantic_search(
                 conn, query_embedding, fetch_k, source_type, tax_year
@@ -82,7 +118,7 @@ class HybridRetriever:
         source_type: str | None = None,
         tax_year: str | None = None,
     ) -> list[RetrievalResult]:
-        """Cosine-distance search via pgvector HNSW index."""
+        """Cosine-distance search via pgvector HNSW index over halfvec embeddings."""
         # $1=embedding, $2=limit, $3+=optional filters
         conditions = ["s.is_active = TRUE", "s.superseded_by IS NULL"]
         filter_params: list[object] = []
@@ -97,6 +133,10 @@ class HybridRetriever:
             conditions.append(f"c.tax_year = ${idx}")
             filter_params.append(tax_year)
             idx += 1
+            # Literal copy of the partial index predicate: a bind parameter
+            # alone can't prove it at plan time, so the index would be skipped
+            if tax_year in _PARTIAL_INDEX_TAX_YEARS:
+                conditions.append(_PARTIAL_INDEX_PREDICATE)
 
         where_clause = " AND ".join(conditions)
 
@@ -104,30 +144,44 @@ class HybridRetriever:
             SELECT c.id AS chunk_id, c.content, c.section_title, c.tax_year,
                    s.url AS source_url, s.title AS source_title,
                    s.source_type,
-                   c.embedding <=> $1 AS distance
+                   c.embedding <=> $1::halfvec AS distance
             FROM document_chunks c
             JOIN document_sources s ON s.id = c.source_id
             WHERE {where_clause}
-            ORDER BY c.embedding <=> $1
+            ORDER BY c.embedding <=> $1::halfvec
             LIMIT $2
         """
 
-        rows = await conn.fetch(
-            sql, np.array(embedding, dtype=np.float32), limit, *filter_params
-        )
-        return [
-            RetrievalResult(
-                chunk_id=r["chunk_id"],
-                content=r["content"],
-                section_title=r["section_title"],
-                source_url=r["source_url"],
-                source_title=r["source_title"],
-                source_type=r["source_type"],
-                tax_year=r["tax_year"],
-                score=1.0 - float(r["distance"]),
+        # SET LOCAL scopes the HNSW tuning to this query's transaction
+        async with conn.transaction():
+            await conn.execute(f"SET LOCAL hnsw.ef_search = {self._ef_search}")
+            await self._enable_iterative_scan(conn)
+            rows = await conn.fetch(
+                sql, np.array(embedding, dtype=np.float32), limit, *filter_params
             )
-            for r in rows
-        ]
+        return [_row_to_result(r, 1.0 - float(r["distance"])) for r in rows]
+
+    async def _enable_iterative_scan(self, conn: asyncpg.Connection) -> None:
+        """Enable strict-order iterative HNSW scans when pgvector supports them.
+
+        Iterative scans keep filtered queries from returning fewer than
+        ``limit`` rows. Older pgvector versions reject the setting, so the
+        first attempt runs in a savepoint and the outcome is remembered; once
+        support is known, the setting is applied directly.
+        """
+        if self._iterative_scan is False:
+            return
+        if self._iterative_scan:
+            await conn.execute("SET LOCAL hnsw.iterative_scan = strict_order")
+            return
+        try:
+            async with conn.transaction():
+                await conn.execute("SET LOCAL hnsw.iterative_scan = strict_order")
+        except asyncpg.PostgresError as e:
+            logger.info("hnsw.iterative_scan unavailable, skipping: %s", e)
+            self._iterative_scan = False
+        else:
+            self._iterative_scan = True
 
     async def _keyword_search(
         self,
@@ -172,19 +226,25 @@ class HybridRetriever:
         """
 
         rows = await conn.fetch(sql, query, limit, *filter_params)
-        return [
-            RetrievalResult(
-                chunk_id=r["chunk_id"],
-                content=r["content"],
-                section_title=r["section_title"],
-                source_url=r["source_url"],
-                source_title=r["source_title"],
-                source_type=r["source_type"],
-                tax_year=r["tax_year"],
-                score=float(r["rank"]),
-            )
-            for r in rows
-        ]
+        return [_row_to_result(r, float(r["rank"])) for r in rows]
+
+
+def _row_to_result(row: asyncpg.Record, score: float) -> RetrievalResult:
+    """Build a RetrievalResult from a search row.
+
+    Column types are already enforced by Postgres, so pydantic validation is
+    skipped with model_construct.
+    """
+    return RetrievalResult.model_construct(
+        chunk_id=row["chunk_id"],
+        content=row["content"],
+        section_title=row["section_title"],
+        source_url=row["source_url"],
+        source_title=row["source_title"],
+        source_type=row["source_type"],
+        tax_year=row["tax_year"],
+        score=score,
+    )
 
 
 def rrf_fuse(
@@ -87,6 +87,12 @@ def mock_db_pool() -> MagicMock:
     conn = AsyncMock()
     conn.fetch.return_value = []
 
+    # conn.transaction() is also an async context manager, not a coroutine
+    txn = MagicMock()
+    txn.__aenter__ = AsyncMock(return_value=None)
+    txn.__aexit__ = AsyncMock(return_value=False)
+    conn.transaction = MagicMock(return_value=txn)
+
     acm = MagicMock()
     acm.__aenter__ = AsyncMock(return_value=conn)
     acm.__aexit__ = AsyncMock(return_value=False)
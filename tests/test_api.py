@@ -7,6 +7,8 @@ from fastapi import FastAPI
 from fastapi.staticfiles import StaticFiles
 from fastapi.testclient import TestClient
 
+from src.api import routes
+from src.api.app import CachedStaticFiles
 from src.api.routes import STATIC_DIR, router
 from src.db.models import AskResponse, SourceReference
 
@@ -149,3 +151,56 @@ def test_ask_without_history_passes_none(app: FastAPI, client: TestClient) -> No
     assert response.status_code == 200
     call_kwargs = mock_orchestrator.ask.call_args
     assert call_kwargs[1]["history"] is None
+
+
+def test_ask_malformed_json(client: TestClient) -> None:
+    """POST /ask with an unparseable body returns 422, not 500."""
+    response = client.post(
+        "/ask", content=b'{"question": ', headers={"content-type": "application/json"}
+    )
+    assert response.status_code == 422
+
+
+def test_stats_caches_query_stats(
+    app: FastAPI, client: TestClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Repeated /stats requests reuse query stats within the TTL."""
+    monkeypatch.setattr(routes, "_stats_cache", None)
+    get_stats = AsyncMock(return_value={"total_queries": 3})
+    monkeypatch.setattr(routes, "get_query_stats", get_stats)
+    app.state.pool = object()
+
+    first = client.get("/stats").json()
+    second = client.get("/stats").json()
+
+    assert first["query_stats"] == second["query_stats"] == {"total_queries": 3}
+    get_stats.assert_awaited_once()
+
+
+def test_health_omits_query_stats(
+    app: FastAPI, client: TestClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """/health is unauthenticated, so it never exposes query stats."""
+    get_stats = AsyncMock(return_value={"total_queries": 3})
+    monkeypatch.setattr(routes, "get_query_stats", get_stats)
+    app.state.pool = object()
+
+    assert client.get("/health").json() == {"status": "ok"}
+    get_stats.assert_not_awaited()
+
+
+def test_static_files_cache_headers() -> None:
+    """CachedStaticFiles adds Cache-Control to full and 304 responses."""
+    static_app = FastAPI()
+    static_app.mount("/static", CachedStaticFiles(directory=str(STATIC_DIR)), name="static")
+    static_client = TestClient(static_app)
+
+    response = static_client.get("/static/favicon.svg")
+    assert response.status_code == 200
+    assert response.headers["cache-control"] == "public, max-age=86400"
+
+    revalidated = static_client.get(
+        "/static/favicon.svg", headers={"if-none-match": response.headers["etag"]}
+    )
+    assert revalidated.status_code == 304
+    assert revalidated.headers["cache-control"] == "public, max-age=86400"
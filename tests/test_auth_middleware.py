@@ -18,6 +18,14 @@ def _build_app() -> FastAPI:
     async def test_route() -> dict[str, str]:
         return {"status": "ok"}
 
+    @app.get("/health")
+    async def health_route() -> dict[str, str]:
+        return {"status": "ok"}
+
+    @app.get("/static/app.js")
+    async def static_route() -> dict[str, str]:
+        return {"status": "ok"}
+
     return app
 
 
@@ -67,3 +75,14 @@ def test_malformed_base64_returns_401() -> None:
     client = TestClient(app)
     response = client.get("/test", headers={"Authorization": "Basic !!!not-base64!!!"})
     assert response.status_code == 401
+
+
+@patch("src.api.app.settings.auth_username", "testuser")
+@patch("src.api.app.settings.auth_password", "testpass123")
+def test_exempt_paths_skip_auth() -> None:
+    """/health and /static/* are served without credentials."""
+    app = _build_app()
+    client = TestClient(app)
+    assert client.get("/health").status_code == 200
+    assert client.get("/static/app.js").status_code == 200
+    assert client.get("/test").status_code == 401
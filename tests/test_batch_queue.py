@@ -0,0 +1,61 @@
+"""Tests for the batched asyncio queue."""
+
+import asyncio
+
+from src._batch_queue import BatchQueue
+
+
+async def test_batches_by_size_then_by_wait() -> None:
+    """Full batches go out at max_items; the remainder after max_wait."""
+    batches: list[list[int]] = []
+
+    async def handler(batch: list[int]) -> None:
+        batches.append(batch)
+
+    queue = BatchQueue(handler, max_items=3, max_wait=0.01)
+    for i in range(7):
+        await queue.put(i)
+    await queue.close()
+
+    assert batches == [[0, 1, 2], [3, 4, 5], [6]]
+    assert not queue.running
+
+
+async def test_handler_errors_are_logged_not_raised() -> None:
+    """A failing batch doesn't stop the collector or wedge flush()."""
+    handled: list[list[str]] = []
+
+    async def handler(batch: list[str]) -> None:
+        if batch == ["bad"]:
+            raise RuntimeError("boom")
+        handled.append(batch)
+
+    queue = BatchQueue(handler, max_items=1, max_wait=0.01)
+    await queue.put("bad")
+    await queue.put("good")
+    await queue.flush()
+
+    assert handled == [["good"]]
+    assert queue.running
+    await queue.close()
+
+
+async def test_concurrent_batches_overlap() -> None:
+    """With concurrent set, a slow batch doesn't hold up the next one."""
+    release = asyncio.Event()
+    started: list[int] = []
+
+    async def handler(batch: list[int]) -> None:
+        started.append(batch[0])
+        if batch[0] == 0:
+            await release.wait()
+
+    queue = BatchQueue(handler, max_items=1, max_wait=0.01, concurrent=True)
+    await queue.put(0)
+    await queue.put(1)
+    while len(started) < 2:
+        await asyncio.sleep(0)
+    release.set()
+    await queue.close()
+
+    assert started == [0, 1]
@@ -5,7 +5,7 @@ from decimal import Decimal
 import pytest
 
 from src.calculators.acc import calculate_acc_levy
-from src.calculators.income_tax import calculate_income_tax
+from src.calculators.income_tax import calculate_income_tax, calculate_income_tax_batch
 from src.calculators.paye import calculate_paye
 from src.calculators.student_loan import (
     calculate_student_loan_repayment,
@@ -63,6 +63,22 @@ class TestIncomeTax:
         # Old: $14,000*10.5% + $34,000*17.5% + $17,000*30% = $1,470+$5,950+$5,100 = $12,520
         assert old["total_tax"] == 12520.0
 
+    def test_income_with_cents(self) -> None:
+        """Cents are taxed exactly: $65,000.55 = $11,720.50 + $0.55 * 30%."""
+        result = calculate_income_tax(Decimal("65000.55"), "2025-26")
+        assert result["total_tax"] == 11720.665
+        assert result["breakdown"][2]["taxable_amount"] == 11500.55
+
+    def test_sub_cent_income_rounds_consistently(self) -> None:
+        """Fractions of a cent round half up once, and every figure uses the rounded income."""
+        result = calculate_income_tax(Decimal("1968.103"), "2025-26")
+        assert result["annual_income"] == 1968.10
+        assert result["breakdown"][0]["taxable_amount"] == 1968.10
+        assert result["total_tax"] == 206.6505
+        rounded_up = calculate_income_tax(Decimal("1968.105"), "2025-26")
+        assert rounded_up["annual_income"] == rounded_up["breakdown"][0]["taxable_amount"]
+        assert rounded_up["annual_income"] == 1968.11
+
     def test_negative_income(self) -> None:
         result = calculate_income_tax(Decimal("-1000"), "2025-26")
         assert "error" in result
@@ -72,6 +88,39 @@ class TestIncomeTax:
         assert "error" in result
 
 
+class TestIncomeTaxBatch:
+    def test_matches_scalar(self) -> None:
+        incomes = [Decimal("0"), Decimal("15600"), Decimal("65000.55"), Decimal("200000")]
+        batch = calculate_income_tax_batch(incomes, "2025-26")
+        for i, income in enumerate(incomes):
+            scalar = calculate_income_tax(income, "2025-26")
+            assert batch["total_tax"][i] == scalar["total_tax"]
+            assert batch["effective_rate"][i] == scalar["effective_rate"]
+            taxes = [b["tax"] for b in scalar["breakdown"]]
+            assert batch["tax"][i][: len(taxes)].tolist() == taxes
+
+    def test_brackets_above_income_are_zero(self) -> None:
+        batch = calculate_income_tax_batch([Decimal("10000")], "2025-26")
+        assert batch["taxable_amount"][0].tolist() == [10000.0, 0.0, 0.0, 0.0, 0.0]
+
+    def test_negative_income(self) -> None:
+        result = calculate_income_tax_batch([Decimal("1000"), Decimal("-1")], "2025-26")
+        assert "error" in result
+
+    def test_income_beyond_int64_range_rejected(self) -> None:
+        """Incomes whose cent-micro products would wrap in int64 are refused."""
+        result = calculate_income_tax_batch([Decimal("3000000000")], "2025-26")
+        assert "error" in result
+        assert calculate_income_tax(Decimal("3000000000"), "2025-26")["total_tax"] > 0
+
+    def test_largest_accepted_income_matches_scalar(self) -> None:
+        income = Decimal("922337203.68")
+        batch = calculate_income_tax_batch([income], "2025-26")
+        scalar = calculate_income_tax(income, "2025-26")
+        assert batch["total_tax"][0] == scalar["total_tax"]
+        assert batch["effective_rate"][0] == scalar["effective_rate"]
+
+
 class TestAccLevy:
     def test_below_cap(self) -> None:
         """$80,000 — below max liable earnings."""
@@ -173,6 +222,12 @@ class TestPaye:
             65000.0 - expected_deductions, abs=0.01
         )
 
+    def test_sub_cent_income_reported_rounded(self) -> None:
+        result = calculate_paye(Decimal("65000.004"), "monthly", False, "2025-26")
+        assert result["annual_income"] == 65000.0
+        assert result["income_tax_detail"]["annual_income"] == 65000.0
+        assert result["annual"]["income_tax"] == 11720.5
+
     def test_fortnightly_period(self) -> None:
         result = calculate_paye(Decimal("65000"), "fortnightly", False, "2025-26")
         assert result["periods_per_year"] == 26
@@ -195,3 +250,21 @@ class TestCrossYear:
         old = calculate_acc_levy(Decimal("100000"), "2023-24")
         new = calculate_acc_levy(Decimal("100000"), "2025-26")
         assert new["annual_levy"] > old["annual_levy"]
+
+
+class TestMemoization:
+    def test_repeat_call_hits_cache(self) -> None:
+        calculate_paye.cache_clear()  # type: ignore[attr-defined]
+        first = calculate_paye(Decimal("80000"), "monthly", True, "2025-26")
+        second = calculate_paye(Decimal("80000"), "monthly", True, "2025-26")
+        assert first == second
+        assert calculate_paye.cache_info().hits == 1  # type: ignore[attr-defined]
+
+    def test_results_are_independent_copies(self) -> None:
+        """Mutating a returned result must not leak into later calls."""
+        first = calculate_income_tax(Decimal("90000"), "2025-26")
+        first["breakdown"][0]["tax"] = -1.0
+        first["total_tax"] = -1.0
+        second = calculate_income_tax(Decimal("90000"), "2025-26")
+        assert second["total_tax"] > 0
+        assert second["breakdown"][0]["tax"] == 1638.0
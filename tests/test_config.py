@@ -0,0 +1,90 @@
+"""Tests for YAML config loading and environment settings."""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from config import _load_pickled, _load_yaml_path, load_yaml_config
+from config.settings import Settings
+
+
+def _write(path: Path, text: str, mtime_ns: int) -> None:
+    path.write_text(text)
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+class TestLoadYamlConfig:
+    def setup_method(self) -> None:
+        _load_pickled.cache_clear()
+
+    def test_loads_repo_config(self) -> None:
+        config = load_yaml_config("embeddings.yaml")
+        assert "embeddings" in config
+
+    def test_writes_sidecar(self, tmp_path: Path) -> None:
+        path = tmp_path / "a.yaml"
+        _write(path, "key: 1\n", 1_000_000_000)
+
+        assert _load_yaml_path(path) == {"key": 1}
+        assert (tmp_path / "a.yaml.pkl").exists()
+
+    def test_fresh_sidecar_is_used(self, tmp_path: Path) -> None:
+        path = tmp_path / "a.yaml"
+        _write(path, "key: 1\n", 1_000_000_000)
+        _load_yaml_path(path)
+        _load_pickled.cache_clear()
+
+        # Same mtime as before: the sidecar wins over the (changed) source
+        _write(path, "key: 2\n", 1_000_000_000)
+        assert _load_yaml_path(path) == {"key": 1}
+
+    def test_modified_source_is_reparsed(self, tmp_path: Path) -> None:
+        path = tmp_path / "a.yaml"
+        _write(path, "key: 1\n", 1_000_000_000)
+        _load_yaml_path(path)
+
+        _write(path, "key: 2\n", 2_000_000_000)
+        os.utime(tmp_path / "a.yaml.pkl", ns=(1_000_000_000, 1_000_000_000))
+        assert _load_yaml_path(path) == {"key": 2}
+
+    def test_returns_independent_copies(self, tmp_path: Path) -> None:
+        path = tmp_path / "a.yaml"
+        _write(path, "items: [1, 2]\n", 1_000_000_000)
+
+        first = _load_yaml_path(path)
+        first["items"].append(3)
+        assert _load_yaml_path(path) == {"items": [1, 2]}
+
+
+class TestSettings:
+    def test_defaults_without_env(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.delenv("RERANKER_ENABLED", raising=False)
+        monkeypatch.delenv("DATABASE_URL", raising=False)
+        settings = Settings.from_env(tmp_path / "missing.env")
+        assert settings.reranker_enabled is True
+        assert settings.database_url_sync.startswith("postgresql://")
+
+    def test_env_file_and_environment(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        env_file = tmp_path / ".env"
+        env_file.write_text(
+            "# comment\n"
+            "AUTH_USERNAME=fileuser\n"
+            "export AUTH_PASSWORD='secret'\n"
+            "RERANKER_ENABLED=false\n"
+        )
+        monkeypatch.setenv("AUTH_USERNAME", "envuser")
+        monkeypatch.delenv("AUTH_PASSWORD", raising=False)
+        monkeypatch.delenv("RERANKER_ENABLED", raising=False)
+
+        settings = Settings.from_env(env_file)
+        assert settings.auth_username == "envuser"
+        assert settings.auth_password == "secret"
+        assert settings.reranker_enabled is False
+
+    def test_invalid_bool_raises(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("RERANKER_ENABLED", "maybe")
+        with pytest.raises(ValueError, match="reranker_enabled"):
+            Settings.from_env(None)
@@ -1,6 +1,8 @@
 """Tests for the HTTP crawler."""
 
+import asyncio
 import hashlib
+from collections.abc import AsyncIterator
 
 import httpx
 import pytest
@@ -10,9 +12,11 @@ from src.ingestion.crawler import Crawler
 
 
 @pytest.fixture
-def crawler() -> Crawler:
+async def crawler() -> AsyncIterator[Crawler]:
     """Crawler with rate limiting disabled for fast tests."""
-    return Crawler(rate_limit=0.0)
+    crawler = Crawler(rate_limit=0.0)
+    yield crawler
+    await crawler.aclose()
 
 
 @pytest.mark.asyncio
@@ -73,6 +77,41 @@ async def test_crawl_http_error_raises(httpx_mock: HTTPXMock, crawler: Crawler)
         await crawler.crawl("https://ird.govt.nz/missing")
 
 
+@pytest.mark.asyncio
+async def test_crawl_html_decodes_declared_charset(
+    httpx_mock: HTTPXMock, crawler: Crawler
+) -> None:
+    """The streamed body is decoded with the response charset and hashed as received."""
+    body = "<p>Māori tax credit</p>".encode("utf-16")
+    httpx_mock.add_response(
+        url="https://ird.govt.nz/page",
+        content=body,
+        headers={"content-type": "text/html; charset=utf-16"},
+    )
+
+    result = await crawler.crawl("https://ird.govt.nz/page")
+
+    assert result.html == "<p>Māori tax credit</p>"
+    assert result.content_hash == hashlib.sha256(body).hexdigest()
+
+
+@pytest.mark.asyncio
+async def test_crawl_with_alternate_hash_algo(httpx_mock: HTTPXMock) -> None:
+    """A configured hash algorithm is used and recorded on the result."""
+    html = "<html><body>Tax info</body></html>"
+    httpx_mock.add_response(url="https://ird.govt.nz/page", text=html)
+
+    result = await Crawler(rate_limit=0.0, hash_algo="blake2b").crawl("https://ird.govt.nz/page")
+
+    assert result.hash_algo == "blake2b"
+    assert result.content_hash == hashlib.blake2b(html.encode(), digest_size=32).hexdigest()
+
+
+def test_unknown_hash_algo_rejected() -> None:
+    with pytest.raises(ValueError, match="Unsupported hash algorithm"):
+        Crawler(hash_algo="md5")
+
+
 @pytest.mark.asyncio
 async def test_content_hash_deterministic(httpx_mock: HTTPXMock, crawler: Crawler) -> None:
     """Same content produces the same SHA256 hash across crawls."""
@@ -85,3 +124,53 @@ async def test_content_hash_deterministic(httpx_mock: HTTPXMock, crawler: Crawle
     r2 = await crawler.crawl("https://ird.govt.nz/stable")
 
     assert r1.content_hash == r2.content_hash
+
+
+@pytest.mark.asyncio
+async def test_crawl_if_changed_skips_known_hash(httpx_mock: HTTPXMock, crawler: Crawler) -> None:
+    """A body matching the known hash yields None; a different hash yields a result."""
+    html = "<html><body>Stable content</body></html>"
+    known = hashlib.sha256(html.encode()).hexdigest()
+    httpx_mock.add_response(url="https://ird.govt.nz/stable", text=html)
+    httpx_mock.add_response(url="https://ird.govt.nz/stable", text=html)
+
+    assert await crawler.crawl_if_changed("https://ird.govt.nz/stable", known) is None
+
+    result = await crawler.crawl_if_changed("https://ird.govt.nz/stable", "stale")
+    assert result is not None
+    assert result.html == html
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_spaces_concurrent_requests() -> None:
+    """Concurrent callers are still spaced at least one interval apart."""
+    crawler = Crawler(rate_limit=0.05)
+    loop = asyncio.get_running_loop()
+    starts: list[float] = []
+
+    async def wait() -> None:
+        await crawler._wait_for_rate_limit()
+        starts.append(loop.time())
+
+    await asyncio.gather(*(wait() for _ in range(3)))
+
+    gaps = [b - a for a, b in zip(starts, starts[1:], strict=False)]
+    assert all(gap >= 0.045 for gap in gaps)
+
+
+@pytest.mark.asyncio
+async def test_client_reused_across_crawls(httpx_mock: HTTPXMock, crawler: Crawler) -> None:
+    """Crawls share one HTTP client until aclose()."""
+    httpx_mock.add_response(url="https://ird.govt.nz/a", text="a")
+    httpx_mock.add_response(url="https://ird.govt.nz/b", text="b")
+
+    await crawler.crawl("https://ird.govt.nz/a")
+    client = crawler._client
+    await crawler.crawl("https://ird.govt.nz/b")
+
+    assert client is not None
+    assert crawler._client is client
+
+    await crawler.aclose()
+    assert client.is_closed
+    assert crawler._client is None
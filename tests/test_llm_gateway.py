@@ -68,3 +68,15 @@ async def test_complete_passes_tools_kwarg(mock_acompletion: AsyncMock) -> None:
     call_kwargs = mock_acompletion.call_args.kwargs
     assert call_kwargs["tools"] == tools
     assert call_kwargs["model"] == "test-model"
+
+
+@pytest.mark.asyncio
+@patch("litellm.acompletion", new_callable=AsyncMock)
+async def test_warmup_swallows_errors(mock_acompletion: AsyncMock) -> None:
+    """warmup() sends a one-token request and never raises."""
+    mock_acompletion.side_effect = RuntimeError("network down")
+
+    gw = LLMGateway(model="test-model")
+    await gw.warmup()
+
+    assert mock_acompletion.call_args.kwargs["max_tokens"] == 1
@@ -103,3 +103,14 @@ class TestParseHtml:
         """
         doc = parse_html(html, "https://example.com")
         assert doc.title == "RWT rates"
+
+    def test_bilingual_heading_skips_hidden_span(self) -> None:
+        """aria-hidden Māori text is left out of section headings."""
+        html = """
+        <html><body><div id="main-content-wrapper">
+            <h2><span aria-hidden="true" lang="mi">Ngā reiti</span> Tax rates</h2>
+            <p>Rates apply from 1 April.</p>
+        </div></body></html>
+        """
+        doc = parse_html(html, "https://example.com")
+        assert [s.heading for s in doc.sections] == ["Tax rates"]
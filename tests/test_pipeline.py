@@ -0,0 +1,229 @@
+"""Tests for the ingestion pipeline."""
+
+import asyncio
+import threading
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.db.models import ChunkData, CrawlResult, ParsedDocument, ParsedSection
+from src.ingestion.pipeline import (
+    _EMBED_BATCH_SIZE,
+    _EMBED_CONCURRENCY,
+    IngestionPipeline,
+    _parse_pdf_off_loop,
+)
+
+_URL = "https://www.ird.govt.nz/income-tax"
+
+
+@pytest.fixture
+def pipeline_with_page(mock_embedder: AsyncMock, mock_db_pool: MagicMock) -> IngestionPipeline:
+    """Pipeline whose crawler returns one changed HTML page, with the DB pool patched in."""
+    crawler = AsyncMock()
+    crawler.crawl_if_changed.return_value = CrawlResult(
+        url=_URL, html="<html></html>", content_hash="ab" * 32, status_code=200
+    )
+    mock_db_pool.fetchrow = AsyncMock(return_value=None)
+    mock_db_pool.execute = AsyncMock()
+    return IngestionPipeline(mock_embedder, crawler=crawler)
+
+
+async def test_embed_chunks_bounded_and_ordered(mock_embedder: AsyncMock) -> None:
+    """Batches run concurrently up to the bound and results keep chunk order."""
+    in_flight = 0
+    peak = 0
+
+    async def embed_documents(batch: list[str]) -> list[list[float]]:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return [[float(text)] for text in batch]
+
+    mock_embedder.embed_documents.side_effect = embed_documents
+    pipeline = IngestionPipeline(mock_embedder, crawler=AsyncMock())
+    count = _EMBED_BATCH_SIZE * (_EMBED_CONCURRENCY + 2) + 3
+    chunks = [ChunkData(content=str(i), chunk_index=i) for i in range(count)]
+
+    embeddings = await pipeline._embed_chunks(chunks)
+
+    assert embeddings == [[float(i)] for i in range(count)]
+    assert peak == _EMBED_CONCURRENCY
+
+
+async def test_embed_chunks_shares_batches_across_documents(mock_embedder: AsyncMock) -> None:
+    """Small documents embedded at the same time share one request."""
+    mock_embedder.embed_documents.side_effect = lambda batch: [[float(t)] for t in batch]
+    pipeline = IngestionPipeline(mock_embedder, crawler=AsyncMock())
+    half = _EMBED_BATCH_SIZE // 2
+    first = [ChunkData(content=str(i), chunk_index=i) for i in range(half)]
+    second = [ChunkData(content=str(half + i), chunk_index=i) for i in range(half)]
+
+    a, b = await asyncio.gather(pipeline._embed_chunks(first), pipeline._embed_chunks(second))
+
+    assert mock_embedder.embed_documents.await_count == 1
+    assert a == [[float(i)] for i in range(half)]
+    assert b == [[float(half + i)] for i in range(half)]
+
+
+async def test_embed_chunks_propagates_errors(mock_embedder: AsyncMock) -> None:
+    mock_embedder.embed_documents.side_effect = RuntimeError("quota exhausted")
+    pipeline = IngestionPipeline(mock_embedder, crawler=AsyncMock())
+
+    with pytest.raises(RuntimeError, match="quota exhausted"):
+        await pipeline._embed_chunks([ChunkData(content="text", chunk_index=0)])
+
+
+async def test_aclose_drains_queue_and_stops_batcher(mock_embedder: AsyncMock) -> None:
+    """Texts still queued at shutdown are embedded before the collector stops."""
+    mock_embedder.embed_documents.side_effect = lambda batch: [[0.0] for _ in batch]
+    pipeline = IngestionPipeline(mock_embedder, crawler=AsyncMock())
+    caller = asyncio.create_task(
+        pipeline._embed_chunks([ChunkData(content="text", chunk_index=0)])
+    )
+    await asyncio.sleep(0)  # let the caller queue its text
+    caller.cancel()
+
+    await pipeline.aclose()
+
+    mock_embedder.embed_documents.assert_awaited_once_with(["text"])
+    assert not pipeline._embed_batcher._texts.running
+
+
+async def test_pdf_parses_never_overlap() -> None:
+    """PyMuPDF isn't thread-safe, so concurrent ingests parse PDFs one at a time."""
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def parse_pdf(pdf_bytes: bytes, url: str) -> ParsedDocument:
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.01)
+        with lock:
+            active -= 1
+        return ParsedDocument(title="", url=url, sections=[])
+
+    with patch("src.ingestion.pipeline.parse_pdf", parse_pdf):
+        await asyncio.gather(*(_parse_pdf_off_loop(b"%PDF", _URL) for _ in range(4)))
+
+    assert peak == 1
+
+
+async def test_process_url_reuses_cached_parse(
+    pipeline_with_page: IngestionPipeline, mock_db_pool: MagicMock
+) -> None:
+    """Content already parsed by the current parser version isn't parsed again."""
+    parsed = ParsedDocument(
+        title="Income tax",
+        url=_URL,
+        sections=[ParsedSection(heading="Rates", content="Tax rates apply.")],
+    )
+    chunk = ChunkData(content="Tax rates apply.", chunk_index=0, section_title="Rates")
+    mock_db_pool.fetchrow.return_value = {
+        "parsed": parsed.model_dump(),
+        "chunks": [chunk.model_dump()],
+    }
+
+    with (
+        patch("src.ingestion.pipeline.get_pool", AsyncMock(return_value=mock_db_pool)),
+        patch("src.ingestion.pipeline.parse_html") as parse_html,
+    ):
+        result = await pipeline_with_page.process_url(
+            _URL, "ird_guidance", force=True, dry_run=True
+        )
+
+    parse_html.assert_not_called()
+    assert result["title"] == "Income tax"
+    assert result["chunks"] == 1
+
+
+async def test_process_url_reparses_unreadable_cached_parse(
+    pipeline_with_page: IngestionPipeline, mock_db_pool: MagicMock
+) -> None:
+    """A cached row that no longer fits the models counts as a cache miss."""
+    mock_db_pool.fetchrow.return_value = {"parsed": {"title": "Old shape"}, "chunks": []}
+    parsed = ParsedDocument(
+        title="Income tax",
+        url=_URL,
+        sections=[ParsedSection(heading="Rates", content="Tax rates apply.")],
+    )
+
+    with (
+        patch("src.ingestion.pipeline.get_pool", AsyncMock(return_value=mock_db_pool)),
+        patch("src.ingestion.pipeline.parse_html", return_value=parsed) as parse_html,
+    ):
+        result = await pipeline_with_page.process_url(
+            _URL, "ird_guidance", force=True, dry_run=True
+        )
+
+    parse_html.assert_called_once()
+    assert result["title"] == "Income tax"
+
+
+async def test_process_url_caches_new_parse(
+    pipeline_with_page: IngestionPipeline, mock_db_pool: MagicMock, ird_guidance_html: str
+) -> None:
+    """A cache miss parses the page and stores the result for the next run."""
+    pipeline_with_page.crawler.crawl_if_changed.return_value.html = ird_guidance_html
+    mock_db_pool.fetch = AsyncMock(return_value=[])
+    pipeline_with_page._embed_chunks = AsyncMock(  # type: ignore[method-assign]
+        side_effect=lambda chunks: [[0.1] * 768 for _ in chunks]
+    )
+    pipeline_with_page._compute_search_vectors = AsyncMock(  # type: ignore[method-assign]
+        side_effect=lambda pool, texts: ["" for _ in texts]
+    )
+    conn = mock_db_pool.acquire.return_value.__aenter__.return_value
+    conn.fetchrow.return_value = {"id": "00000000-0000-0000-0000-000000000001"}
+
+    with patch("src.ingestion.pipeline.get_pool", AsyncMock(return_value=mock_db_pool)):
+        result = await pipeline_with_page.process_url(_URL, "ird_guidance", force=True)
+
+    mock_db_pool.execute.assert_awaited_once()
+    cached_chunks = mock_db_pool.execute.call_args.args[6]
+    assert len(cached_chunks) == result["chunks"] > 0
+
+
+async def test_process_url_skips_cache_for_followed_pdf(
+    pipeline_with_page: IngestionPipeline, mock_db_pool: MagicMock
+) -> None:
+    """A stub page's hash doesn't cover its linked PDF, so the merged parse isn't cached."""
+    stub = ParsedDocument(
+        title="QB 25/01",
+        url=_URL,
+        sections=[ParsedSection(heading="Summary", content="See the PDF for details.")],
+        pdf_url="https://www.ird.govt.nz/qb25-01.pdf",
+    )
+    pipeline_with_page.crawler.crawl.return_value = CrawlResult(
+        url=stub.pdf_url, html="", content_hash="cd" * 32, status_code=200,
+        raw_bytes=b"%PDF", content_type="pdf",
+    )
+    pdf = ParsedDocument(
+        title="QB 25/01",
+        url=_URL,
+        sections=[ParsedSection(heading="Question", content="Is this taxable? Yes.")],
+    )
+    mock_db_pool.fetch = AsyncMock(return_value=[])
+    pipeline_with_page._embed_chunks = AsyncMock(  # type: ignore[method-assign]
+        side_effect=lambda chunks: [[0.1] * 768 for _ in chunks]
+    )
+    pipeline_with_page._compute_search_vectors = AsyncMock(  # type: ignore[method-assign]
+        side_effect=lambda pool, texts: ["" for _ in texts]
+    )
+    conn = mock_db_pool.acquire.return_value.__aenter__.return_value
+    conn.fetchrow.return_value = {"id": "00000000-0000-0000-0000-000000000001"}
+
+    with (
+        patch("src.ingestion.pipeline.get_pool", AsyncMock(return_value=mock_db_pool)),
+        patch("src.ingestion.pipeline.parse_html", return_value=stub),
+        patch("src.ingestion.pipeline.parse_pdf", return_value=pdf),
+    ):
+        result = await pipeline_with_page.process_url(_URL, "ird_guidance", force=True)
+
+    assert result["sections"] == 2
+    mock_db_pool.execute.assert_not_awaited()
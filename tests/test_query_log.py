@@ -0,0 +1,41 @@
+"""Tests for buffered query logging."""
+
+from unittest.mock import MagicMock
+from uuid import UUID, uuid4
+
+from src.db.query_log import flush_query_log, log_query, update_feedback
+from src.db.session import _decode_jsonb, _encode_jsonb
+
+
+async def test_log_query_batches_rows_into_one_copy(mock_db_pool: MagicMock) -> None:
+    """Queued rows are written together with a single COPY."""
+    first = await log_query(mock_db_pool, "Q1", "A1", "model", 120)
+    second = await log_query(
+        mock_db_pool, "Q2", "A2", "model", 80, tool_calls=[{"name": "calculate_paye"}]
+    )
+    await flush_query_log()
+
+    assert isinstance(first, UUID)
+    assert first != second
+    conn = mock_db_pool.acquire.return_value.__aenter__.return_value
+    conn.copy_records_to_table.assert_awaited_once()
+    records = conn.copy_records_to_table.call_args.kwargs["records"]
+    assert [r[0] for r in records] == [first, second]
+    assert records[1][5] == [{"name": "calculate_paye"}]
+
+
+async def test_update_feedback_retries_after_flush(mock_db_pool: MagicMock) -> None:
+    """A feedback update that finds no row retries once after pending rows are written."""
+    conn = mock_db_pool.acquire.return_value.__aenter__.return_value
+    conn.execute.side_effect = ["UPDATE 0", "UPDATE 1"]
+
+    assert await update_feedback(mock_db_pool, uuid4(), "positive") is True
+    assert conn.execute.await_count == 2
+
+
+def test_jsonb_codec_round_trip() -> None:
+    """The binary jsonb codec prefixes the format version byte."""
+    value = [{"name": "search_tax_documents", "args": {"query": "PAYE"}}]
+    encoded = _encode_jsonb(value)
+    assert encoded[:1] == b"\x01"
+    assert _decode_jsonb(encoded) == value
@@ -3,6 +3,7 @@
 from unittest.mock import AsyncMock, call
 from uuid import uuid4
 
+import asyncpg
 import pytest
 
 from src.db.models import RetrievalResult
@@ -217,3 +218,97 @@ async def test_search_without_filters_no_extra_params(
         sql = args[0]
         assert "$3" not in sql
         assert "$4" not in sql
+
+
+# --- HNSW session tuning tests ---
+
+
+@pytest.mark.asyncio
+async def test_semantic_search_sets_ef_search(
+    mock_embedder: AsyncMock, mock_db_pool: AsyncMock
+) -> None:
+    """ef_search and iterative scan are set transaction-locally."""
+    conn = mock_db_pool.acquire.return_value.__aenter__.return_value
+    conn.fetch.side_effect = [[], []]
+
+    retriever = HybridRetriever(mock_db_pool, mock_embedder, ef_search=120)
+    await retriever.search("tax brackets")
+
+    executed = [c[0][0] for c in conn.execute.call_args_list]
+    assert "SET LOCAL hnsw.ef_search = 120" in executed
+    assert "SET LOCAL hnsw.iterative_scan = strict_order" in executed
+    conn.transaction.assert_called()
+
+
+@pytest.mark.asyncio
+async def test_iterative_scan_savepoint_only_on_first_probe(
+    mock_embedder: AsyncMock, mock_db_pool: AsyncMock
+) -> None:
+    """Once iterative_scan is known to work, later searches skip the savepoint."""
+    conn = mock_db_pool.acquire.return_value.__aenter__.return_value
+    conn.fetch.side_effect = [[], [], [], []]
+
+    retriever = HybridRetriever(mock_db_pool, mock_embedder)
+    await retriever.search("first")
+    first_transactions = conn.transaction.call_count
+    await retriever.search("second")
+
+    assert conn.transaction.call_count - first_transactions == first_transactions - 1
+    executed = [c[0][0] for c in conn.execute.call_args_list]
+    assert executed.count("SET LOCAL hnsw.iterative_scan = strict_order") == 2
+
+
+@pytest.mark.asyncio
+async def test_iterative_scan_unsupported_is_skipped(
+    mock_embedder: AsyncMock, mock_db_pool: AsyncMock
+) -> None:
+    """Older pgvector without iterative_scan is tolerated and not retried."""
+    conn = mock_db_pool.acquire.return_value.__aenter__.return_value
+    conn.fetch.side_effect = [[], [], [], []]
+    conn.execute.side_effect = [
+        None,
+        asyncpg.PostgresError("unrecognized configuration parameter"),
+        None,
+    ]
+
+    retriever = HybridRetriever(mock_db_pool, mock_embedder)
+    await retriever.search("first")
+    await retriever.search("second")
+
+    executed = [c[0][0] for c in conn.execute.call_args_list]
+    assert executed.count("SET LOCAL hnsw.iterative_scan = strict_order") == 1
+    assert conn.fetch.await_count == 4
+
+
+@pytest.mark.asyncio
+async def test_search_by_vector_skips_embedding(
+    mock_embedder: AsyncMock, mock_db_pool: AsyncMock
+) -> None:
+    """search_by_vector() uses the given embedding without calling the embedder."""
+    conn = mock_db_pool.acquire.return_value.__aenter__.return_value
+    conn.fetch.side_effect = [[_make_db_row(content="Semantic hit")], []]
+
+    retriever = HybridRetriever(mock_db_pool, mock_embedder)
+    results = await retriever.search_by_vector("PAYE rates", [0.2] * 768, top_k=3)
+
+    mock_embedder.embed_query.assert_not_awaited()
+    assert [r.content for r in results] == ["Semantic hit"]
+    assert "PAYE rates" in _str_args(conn.fetch.call_args_list[1])
+
+
+@pytest.mark.asyncio
+async def test_current_tax_year_matches_partial_index(
+    mock_embedder: AsyncMock, mock_db_pool: AsyncMock
+) -> None:
+    """Hot tax years add the partial index predicate to the semantic query only."""
+    conn = mock_db_pool.acquire.return_value.__aenter__.return_value
+    conn.fetch.side_effect = [[], [], [], []]
+
+    retriever = HybridRetriever(mock_db_pool, mock_embedder)
+    await retriever.search("tax brackets", tax_year="2025-26")
+    await retriever.search("tax brackets", tax_year="2023-24")
+
+    sqls = [c[0][0] for c in conn.fetch.call_args_list]
+    assert "c.tax_year IN ('2024-25', '2025-26')" in sqls[0]
+    assert "c.tax_year IN" not in sqls[1]
+    assert "c.tax_year IN" not in sqls[2]
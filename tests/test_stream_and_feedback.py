@@ -1,5 +1,6 @@
 """Tests for /ask/stream SSE endpoint, /feedback endpoint, and LLMGateway.stream()."""
 
+import asyncio
 import json
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
@@ -9,7 +10,7 @@ from fastapi import FastAPI
 from fastapi.staticfiles import StaticFiles
 from fastapi.testclient import TestClient
 
-from src.api.routes import STATIC_DIR, router
+from src.api.routes import STATIC_DIR, AskRequest, ask_stream, router
 from src.llm.gateway import LLMGateway
 
 # --- Fixtures ---
@@ -96,6 +97,29 @@ def test_ask_stream_handles_error(app: FastAPI, client: TestClient) -> None:
     assert any(e["type"] == "error" for e in events)
 
 
+async def test_ask_stream_flushes_buffered_chunk_during_stall() -> None:
+    """A buffered chunk is sent within the batch window, not when the next event arrives."""
+    stall = asyncio.Event()
+
+    async def stalled_stream(question: str, history=None):  # type: ignore[no-untyped-def]
+        yield {"type": "chunk", "delta": "The "}
+        yield {"type": "chunk", "delta": "answer."}
+        await stall.wait()
+        yield {"type": "done", "model": "test-model", "query_id": None}
+
+    request = MagicMock()
+    request.app.state.orchestrator.ask_stream = stalled_stream
+    response = await ask_stream(AskRequest(question="Q"), request)
+    body = response.body_iterator
+
+    received = b""
+    while b"answer." not in received:
+        received += await asyncio.wait_for(anext(body), timeout=1.0)  # type: ignore[arg-type]
+    stall.set()
+    received += b"".join([chunk async for chunk in body])  # type: ignore[misc]
+    assert b'"done"' in received
+
+
 def test_ask_stream_missing_question(client: TestClient) -> None:
     """POST /ask/stream without question returns 422."""
     response = client.post("/ask/stream", json={})